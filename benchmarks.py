@@ -0,0 +1,478 @@
+"""
+Performance Benchmarks for the Seed-Based Crypto Framework and the Divisor-Free Generators
+- Unified suite: every generator across divisor-set sizes and counts, and the
+  encrypt/decrypt/inverse-table paths across message sizes and degrees, reporting
+  throughput, median and p99 latency (min/max as extras) and peak memory as
+  JSON, with baseline regression checks
+- Side-by-side comparisons: per-character vs table-driven crypto paths, algebraic
+  key recovery vs sampling, residue-class generators vs trial division, import time
+
+Usage:
+    python benchmarks.py [--quick] [--json OUT] [--baseline FILE] [--tolerance 0.25] [--comparisons]
+                         [--profile]
+"""
+
+import sys
+import json
+import time
+import secrets
+import argparse
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import profiling
+from seed_based_crypto import (
+    generate_polynomial_function, generate_seeds, encrypt_message,
+    build_forward_table, encrypt_message_batch, build_inverse_function, decrypt_message,
+    build_inverse_table, decrypt_message_batch, ASCII_DOMAIN_SIZE
+)
+from seed_test_attack import known_plaintext_attack, algebraic_known_plaintext_attack
+
+# --------------------------------------------------
+# Helpers
+# --------------------------------------------------
+
+def random_ascii_message(size: int) -> str:
+    return ''.join(chr(secrets.randbelow(ASCII_DOMAIN_SIZE)) for _ in range(size))
+
+def time_call(fn: Callable[[], object], repeat: int = 3) -> float:
+    """
+    Returns the best wall time (seconds) over `repeat` runs.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# --------------------------------------------------
+# Encryption Throughput
+# --------------------------------------------------
+
+def bench_encrypt_throughput(size: int = 1_000_000, degree: int = 3) -> Dict[str, float]:
+    """
+    Compares encrypt_message against encrypt_message_batch on a random ASCII message.
+    Returns throughput in MB/s for both paths plus the table build time.
+    """
+    seeds = generate_seeds(degree=degree, bit_length=16)
+    func = generate_polynomial_function(seeds)
+    message = random_ascii_message(size)
+
+    table_time = time_call(lambda: build_forward_table(func))
+    table = build_forward_table(func)
+    assert encrypt_message_batch(message, table) == encrypt_message(message, func)
+
+    per_char = time_call(lambda: encrypt_message(message, func), repeat=1)
+    batch = time_call(lambda: encrypt_message_batch(message, table))
+    return {
+        'size': size,
+        'degree': degree,
+        'table_build_s': table_time,
+        'per_char_mb_s': size / per_char / 1e6,
+        'batch_mb_s': size / batch / 1e6,
+        'speedup': per_char / batch,
+    }
+
+# --------------------------------------------------
+# Decryption Throughput
+# --------------------------------------------------
+
+def bench_decrypt_throughput(size: int = 1_000_000, degree: int = 3) -> Dict[str, float]:
+    """
+    Compares decrypt_message (closure per word) against decrypt_message_batch,
+    and reports the batch encryption rate on the same data for reference.
+    """
+    seeds = generate_seeds(degree=degree, bit_length=16)
+    func = generate_polynomial_function(seeds)
+    message = random_ascii_message(size)
+    table = build_forward_table(func)
+    cipher = encrypt_message_batch(message, table)
+    inverse = build_inverse_table(table)
+    assert decrypt_message_batch(cipher, inverse) == message
+
+    per_word = time_call(lambda: decrypt_message(cipher, build_inverse_function(func)), repeat=1)
+    batch = time_call(lambda: decrypt_message_batch(cipher, inverse))
+    encrypt = time_call(lambda: encrypt_message_batch(message, table))
+    return {
+        'size': size,
+        'degree': degree,
+        'per_word_mb_s': size / per_word / 1e6,
+        'batch_mb_s': size / batch / 1e6,
+        'encrypt_batch_mb_s': size / encrypt / 1e6,
+        'speedup': per_word / batch,
+    }
+
+# --------------------------------------------------
+# Known-Plaintext Attack: Solver vs Sampling
+# --------------------------------------------------
+
+def bench_known_plaintext_recovery(degrees=(1, 3, 5), bit_lengths=(8, 16, 24)) -> List[Dict[str, object]]:
+    """
+    For each (degree, seed bit length) encrypts degree+1 distinct known characters,
+    then times the algebraic solver and the random-sampling known_plaintext_attack,
+    both drawing seeds of that bit length.
+    """
+    rows = []
+    known = ''.join(chr(c) for c in range(65, 65 + max(degrees) + 1))
+    for degree in degrees:
+        for bit_length in bit_lengths:
+            seeds = generate_seeds(degree=degree, bit_length=bit_length)
+            plain = known[:degree + 1]
+            cipher = encrypt_message(plain, generate_polynomial_function(seeds))
+
+            solved = algebraic_known_plaintext_attack(cipher, plain, degree, bit_length)
+            start = time.perf_counter()
+            match_rate = known_plaintext_attack(cipher, plain[0], degree, bit_length)
+            sampling_s = time.perf_counter() - start
+            rows.append({
+                'degree': degree,
+                'bit_length': bit_length,
+                'solver_s': solved['elapsed'],
+                'solver_recovered': solved['solutions'] == [seeds],
+                'sampling_s': sampling_s,
+                'sampling_match_rate': match_rate,
+            })
+    return rows
+
+# --------------------------------------------------
+# Generators: Residue Classes vs Trial Division
+# --------------------------------------------------
+
+def _compare(name: str, baseline: Callable[[], object], candidate: Callable[[], object]) -> Dict[str, object]:
+    base_s = time_call(baseline, repeat=1)
+    cand_s = time_call(candidate, repeat=1)
+    return {
+        'generator': name,
+        'trial_division_s': base_s,
+        'residue_s': cand_s,
+        'speedup': base_s / cand_s if cand_s > 0 else float('inf'),
+        'identical': baseline() == candidate(),
+    }
+
+def bench_residue_generators() -> List[Dict[str, object]]:
+    """
+    Runs every method that keeps its trial-division loop on the divisor lists from
+    its script's example section. The other methods screen by residues only.
+    """
+    import method_1
+
+    D1 = [3, 5, 7, 11]
+    return [
+        _compare('method_1', lambda: method_1.method1_lcm_offset_odd_only(D1, 100_000),
+                 lambda: method_1.method1_lcm_offset_odd_only_sieved(D1, 100_000)),
+    ]
+
+# --------------------------------------------------
+# Import Time
+# --------------------------------------------------
+
+LIBRARY_MODULES = [
+    'method_1', 'method_2', 'method_2_1', 'method_3', 'method_3_1',
+    'divisor_residues', 'prime_sieve',
+    'seed_based_crypto', 'seed_crypto_framework', 'seed_container', 'seed_test_attack',
+]
+IMPORT_BUDGET_S = 0.1  # Per-module import budget in a fresh interpreter
+
+def bench_import_times(modules: List[str] = LIBRARY_MODULES) -> List[Dict[str, object]]:
+    """
+    Imports each module in a fresh interpreter and reports the import wall time,
+    whether it stayed within IMPORT_BUDGET_S and whether importing printed anything.
+    """
+    probe = ("import time, io, contextlib\n"
+             "buf = io.StringIO()\n"
+             "start = time.perf_counter()\n"
+             "with contextlib.redirect_stdout(buf):\n"
+             "    import {module}\n"
+             "print(time.perf_counter() - start, len(buf.getvalue()))")
+    rows = []
+    for module in modules:
+        out = subprocess.run([sys.executable, '-c', probe.format(module=module)],
+                             capture_output=True, text=True, check=True).stdout.split()
+        seconds, printed = float(out[0]), int(out[1])
+        rows.append({
+            'module': module,
+            'import_s': seconds,
+            'within_budget': seconds <= IMPORT_BUDGET_S,
+            'silent': printed == 0,
+        })
+    return rows
+
+# --------------------------------------------------
+# Benchmark Harness
+# --------------------------------------------------
+
+DEFAULT_TOLERANCE = 0.25  # Allowed p50 slowdown against the baseline
+P99_MIN_SAMPLES = 100  # Fewer samples make p99 just the maximum
+SAMPLE_BUDGET_S = 2.0  # Time a case may keep sampling to reach P99_MIN_SAMPLES
+
+def measure(name: str, fn: Callable[[], object], items: int, repeat: int = 5,
+            params: Optional[Dict[str, object]] = None,
+            budget_s: float = SAMPLE_BUDGET_S) -> Dict[str, object]:
+    """
+    Runs fn at least `repeat` times, then keeps sampling until P99_MIN_SAMPLES runs or
+    budget_s seconds of sampling, so fast cases get a real p99; min/max are reported
+    too. Runs once more under tracemalloc for peak memory. `items` is the work per call
+    (values or bytes) for throughput. p99 is None for cases too slow to reach
+    P99_MIN_SAMPLES within the budget.
+    """
+    samples = []
+    deadline = time.perf_counter() + budget_s
+    while len(samples) < repeat or (len(samples) < P99_MIN_SAMPLES and time.perf_counter() < deadline):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    p50 = statistics.median(samples)
+    p99 = None
+    if len(samples) >= P99_MIN_SAMPLES:
+        p99 = samples[min(len(samples) - 1, round(0.99 * (len(samples) - 1)))]
+    return {
+        'name': name,
+        'params': params or {},
+        'items': items,
+        'samples': len(samples),
+        'min_s': samples[0],
+        'p50_s': p50,
+        'max_s': samples[-1],
+        'p99_s': p99,
+        'throughput_per_s': items / p50 if p50 > 0 else float('inf'),
+        'peak_kib': peak / 1024,
+    }
+
+# --------------------------------------------------
+# Suite
+# --------------------------------------------------
+
+SUITE_PRIMES = [3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+EXTRA_PRIMES = [53, 59, 61, 67, 71, 73, 79]
+
+def generator_cases(quick: bool = False) -> List[Tuple[str, Dict[str, object], Callable[[], List[int]]]]:
+    """
+    (name, params, call) for every generator and variant over divisor-set sizes and counts.
+    """
+    import method_1, method_2, method_2_1, method_3, method_3_1
+
+    sizes = [4, 8] if quick else [4, 8, 14]
+    counts = [1_000] if quick else [1_000, 100_000]
+    cases = []
+    for size in sizes:
+        D = SUITE_PRIMES[:size]
+        for count in counts:
+            params = {'divisors': size, 'count': count}
+            cases += [
+                ('method_1', params, lambda D=D, c=count: method_1.method1_lcm_offset_odd_only(D, c)),
+                ('method_1/sieved', params, lambda D=D, c=count: method_1.method1_lcm_offset_odd_only_sieved(D, c)),
+            ]
+        params = {'divisors': size, 'count': 1000}
+        cases += [
+            ('method_2', params, lambda D=D: method_2.method_lcm_power_offset(D, 1000)[0]),
+            ('method_2/uncapped', params,
+             lambda D=D: method_2.method_lcm_power_offset(D, 1000, max_power=None)[0]),
+            ('method_2_1', params, lambda D=D: method_2_1.enhanced_lcm_method(D, EXTRA_PRIMES, 1000, 20, 10)[0]),
+        ]
+    for size in ([3, 6] if quick else [3, 6, 9]):
+        D = set(SUITE_PRIMES[:size])
+        params = {'divisors': size, 'count': 10_000}
+        cases += [
+            ('method_3', params, lambda D=D: method_3.generate_valid_combinations(D, 10_000)[0]),
+        ]
+    for size in ([2, 4] if quick else [2, 4, 6]):
+        D = set(SUITE_PRIMES[:size])
+        params = {'divisors': size, 'count': 10_000}
+        cases += [
+            ('method_3_1', params, lambda D=D: method_3_1.generate_method3_values(D, 10_000)),
+            ('method_3_1/sorted', params, lambda D=D: method_3_1.generate_method3_values_sorted(D, 10_000)),
+        ]
+    return cases
+
+def run_generator_suite(quick: bool = False) -> List[Dict[str, object]]:
+    rows = []
+    for name, params, call in generator_cases(quick):
+        produced = len(call())
+        rows.append(measure(name, call, produced, repeat=3 if quick else 5, params=params,
+                            budget_s=SAMPLE_BUDGET_S / 4 if quick else SAMPLE_BUDGET_S))
+    return rows
+
+def run_crypto_suite(quick: bool = False) -> List[Dict[str, object]]:
+    """
+    Encryption (per-character and batch), decryption (per-word and batch) and
+    inverse-table build across message sizes and polynomial degrees.
+    """
+    rows = []
+    sizes = [1_000, 100_000] if quick else [1_000, 100_000, 1_000_000]
+    budget = SAMPLE_BUDGET_S / 4 if quick else SAMPLE_BUDGET_S
+    for degree in (3, 8):
+        seeds = generate_seeds(degree=degree, bit_length=16)
+        func = generate_polynomial_function(seeds)
+        table = build_forward_table(func)
+        inverse = build_inverse_table(table)
+        rows.append(measure('crypto/inverse_table', lambda: build_inverse_table(build_forward_table(func)),
+                            ASCII_DOMAIN_SIZE, params={'degree': degree}, budget_s=budget))
+        for size in sizes:
+            message = random_ascii_message(size)
+            cipher = encrypt_message_batch(message, table)
+            params = {'degree': degree, 'bytes': size}
+            repeat = 1 if size >= 1_000_000 else 3
+            rows += [
+                measure('crypto/encrypt', lambda: encrypt_message(message, func), size, repeat, params, budget),
+                measure('crypto/encrypt_batch', lambda: encrypt_message_batch(message, table), size, repeat,
+                        params, budget),
+                measure('crypto/decrypt', lambda: decrypt_message(cipher, build_inverse_function(func)),
+                        size, repeat, params, budget),
+                measure('crypto/decrypt_batch', lambda: decrypt_message_batch(cipher, inverse), size, repeat,
+                        params, budget),
+            ]
+    return rows
+
+def run_suite(quick: bool = False) -> Dict[str, object]:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'quick': quick,
+        'results': run_generator_suite(quick) + run_crypto_suite(quick),
+    }
+
+# --------------------------------------------------
+# Baseline Comparison
+# --------------------------------------------------
+
+def _case_key(row: Dict[str, object]) -> str:
+    return row['name'] + json.dumps(row['params'], sort_keys=True)
+
+def compare_to_baseline(report: Dict[str, object], baseline: Dict[str, object],
+                        tolerance: float = DEFAULT_TOLERANCE) -> List[Dict[str, object]]:
+    """
+    Returns every case whose p50 latency exceeds the baseline's by more than `tolerance`.
+    Cases missing from either report are ignored.
+    """
+    previous = {_case_key(row): row for row in baseline['results']}
+    regressions = []
+    for row in report['results']:
+        old = previous.get(_case_key(row))
+        if old is None or old['p50_s'] <= 0:
+            continue
+        ratio = row['p50_s'] / old['p50_s']
+        if ratio > 1 + tolerance:
+            regressions.append({'name': row['name'], 'params': row['params'],
+                                'baseline_p50_s': old['p50_s'], 'p50_s': row['p50_s'], 'ratio': ratio})
+    return regressions
+
+def print_report(report: Dict[str, object]) -> None:
+    print(f"{'case':<24} {'params':<32} {'runs':>6} {'p50 ms':>10} {'p99 ms':>10} {'min ms':>10} {'max ms':>10} "
+          f"{'items/s':>14} {'peak KiB':>10}")
+    for row in report['results']:
+        params = ', '.join(f"{k}={v}" for k, v in row['params'].items())
+        p99 = f"{row['p99_s'] * 1e3:>10.2f}" if row['p99_s'] is not None else f"{'-':>10}"
+        print(f"{row['name']:<24} {params:<32} {row['samples']:>6} {row['p50_s'] * 1e3:>10.2f} {p99} "
+              f"{row['min_s'] * 1e3:>10.2f} {row['max_s'] * 1e3:>10.2f} {row['throughput_per_s']:>14,.0f} "
+              f"{row['peak_kib']:>10.1f}")
+
+def print_profile(profile: Dict[str, object]) -> None:
+    print(f"{'phase':<36} {'calls':>8} {'total ms':>10} {'max ms':>10}")
+    for name, stats in sorted(profile['phases'].items()):
+        print(f"{name:<36} {stats['calls']:>8} {stats['total_s'] * 1e3:>10.2f} {stats['max_s'] * 1e3:>10.2f}")
+    print(f"\n{'counter':<36} {'value':>14}")
+    for name, value in sorted(profile['counters'].items()):
+        print(f"{name:<36} {value:>14,}")
+    for name, value in profile['sources'].items():
+        print(f"\n{name}: {value}")
+
+# --------------------------------------------------
+# Side-by-Side Comparisons
+# --------------------------------------------------
+
+def print_comparisons() -> None:
+    print("=== IMPORT TIME ===")
+    for r in bench_import_times():
+        print(f"{r['module']}: {r['import_s'] * 1e3:.2f} ms "
+              f"(within budget: {r['within_budget']}, silent: {r['silent']})")
+
+
+    print("\n=== ENCRYPTION THROUGHPUT ===")
+    for degree in (3, 8):
+        r = bench_encrypt_throughput(size=1_000_000, degree=degree)
+        print(f"degree={r['degree']} size={r['size']}: "
+              f"per-char {r['per_char_mb_s']:.2f} MB/s, "
+              f"batch {r['batch_mb_s']:.2f} MB/s "
+              f"(x{r['speedup']:.1f}, table build {r['table_build_s'] * 1e3:.2f} ms)")
+
+    print("\n=== DECRYPTION THROUGHPUT ===")
+    for degree in (3, 8):
+        r = bench_decrypt_throughput(size=1_000_000, degree=degree)
+        print(f"degree={r['degree']} size={r['size']}: "
+              f"per-word {r['per_word_mb_s']:.2f} MB/s, "
+              f"batch {r['batch_mb_s']:.2f} MB/s "
+              f"(x{r['speedup']:.1f}, batch encrypt {r['encrypt_batch_mb_s']:.2f} MB/s)")
+
+    print("\n=== KNOWN-PLAINTEXT RECOVERY: SOLVER VS SAMPLING ===")
+    for r in bench_known_plaintext_recovery():
+        print(f"degree={r['degree']} bits={r['bit_length']}: "
+              f"solver {r['solver_s'] * 1e3:.2f} ms (recovered: {r['solver_recovered']}), "
+              f"sampling {r['sampling_s']:.2f} s (match rate {r['sampling_match_rate']:.6f}%)")
+
+    print("\n=== GENERATORS: RESIDUE CLASSES VS TRIAL DIVISION ===")
+    for r in bench_residue_generators():
+        print(f"{r['generator']}: trial division {r['trial_division_s'] * 1e3:.2f} ms, "
+              f"residue {r['residue_s'] * 1e3:.2f} ms (x{r['speedup']:.1f}, identical: {r['identical']})")
+
+# --------------------------------------------------
+# Entry Point
+# --------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the generators and the crypto workflow.")
+    parser.add_argument('--quick', action='store_true', help="smaller sizes and fewer repeats")
+    parser.add_argument('--json', metavar='OUT', help="write the machine-readable report to OUT")
+    parser.add_argument('--baseline', metavar='FILE', help="compare against a stored JSON report")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed p50 slowdown before flagging a regression (default: %(default)s)")
+    parser.add_argument('--comparisons', action='store_true', help="also print the side-by-side comparisons")
+    parser.add_argument('--profile', action='store_true',
+                        help="record hot-path counters and phase timers and add them to the report")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        profiling.enable()
+    report = run_suite(quick=args.quick)
+    if args.profile:
+        report['profile'] = profiling.snapshot()
+    print_report(report)
+    if args.profile:
+        print()
+        print_profile(report['profile'])
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+        report['regressions'] = regressions
+        for r in regressions:
+            params = ', '.join(f"{k}={v}" for k, v in r['params'].items())
+            print(f"REGRESSION {r['name']} ({params}): {r['baseline_p50_s'] * 1e3:.2f} ms -> "
+                  f"{r['p50_s'] * 1e3:.2f} ms (x{r['ratio']:.2f})")
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(report, f, indent=2)
+        status = 1 if regressions else 0
+
+    if args.comparisons:
+        print()
+        print_comparisons()
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
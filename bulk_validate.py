@@ -0,0 +1,84 @@
+"""
+Bulk Validator for the Division-Free Generators
+Checks whole result arrays against a divisor set. Each value is reduced once
+modulo M = LCM(D) (n is divisible by d ∈ D exactly when n mod M is), and the
+residue is looked up in a precomputed table of residues that some d divides.
+Work is done in chunks and can be spread across processes for very large inputs.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import compress, repeat
+from math import lcm
+from operator import mod
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# --------------------------------------------------
+# Constants
+# --------------------------------------------------
+
+RESIDUE_TABLE_LIMIT = 1 << 23  # Largest M given a full bad-residue table
+CHUNK_SIZE = 1 << 16
+PARALLEL_THRESHOLD = 1 << 20  # Inputs smaller than this stay in-process
+
+# --------------------------------------------------
+# Residue Tables
+# --------------------------------------------------
+
+@lru_cache(maxsize=64)
+def _residue_checker(divisors: Tuple[int, ...]) -> Tuple[int, Callable[[int], int]]:
+    """
+    Returns (M, bad) where bad(r) is truthy when some d divides a value ≡ r (mod M).
+    """
+    M = lcm(*divisors) if divisors else 1
+    if M <= RESIDUE_TABLE_LIMIT:
+        table = bytearray(M)
+        for d in divisors:
+            table[::d] = b'\x01' * len(range(0, M, d))
+        return M, table.__getitem__
+    return M, lambda r: any(r % d == 0 for d in divisors)
+
+def _chunk_error_offsets(task: Tuple[Sequence[int], Tuple[int, ...]]) -> List[int]:
+    chunk, divisors = task
+    M, bad = _residue_checker(divisors)
+    flags = map(bad, map(mod, chunk, repeat(M)))
+    return list(compress(range(len(chunk)), flags))
+
+# --------------------------------------------------
+# Bulk Validation
+# --------------------------------------------------
+
+def bulk_error_indices(results: Sequence[int], divisors: Iterable[int], chunk_size: int = CHUNK_SIZE,
+                       workers: Optional[int] = None) -> List[int]:
+    """
+    Indices of every value divisible by some d in divisors, in ascending order.
+    Chunks run in a process pool when workers > 1 and the input is large.
+    """
+    if not isinstance(results, (list, tuple)):
+        results = list(results)
+    key = tuple(sorted({abs(d) for d in divisors}))
+    if 0 in key:
+        raise ValueError("Divisor set must not contain 0.")
+    starts = range(0, len(results), chunk_size)
+    tasks = [(results[s:s + chunk_size], key) for s in starts]
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(results) >= PARALLEL_THRESHOLD else 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            offsets = list(pool.map(_chunk_error_offsets, tasks))
+    else:
+        offsets = list(map(_chunk_error_offsets, tasks))
+    return [s + i for s, chunk in zip(starts, offsets) for i in chunk]
+
+def validate_bulk(results: Sequence[int], divisors: Iterable[int], **kwargs) -> Dict[str, object]:
+    """
+    Same report as method_2_1.validate_results: total, errors, error_rate, error_indices.
+    """
+    error_indices = bulk_error_indices(results, divisors, **kwargs)
+    return {
+        'total': len(results),
+        'errors': len(error_indices),
+        'error_rate': (len(error_indices) / len(results)) * 100 if results else 0,
+        'error_indices': error_indices
+    }
@@ -0,0 +1,162 @@
+"""
+Collision / Injectivity Analyzer for Seed Polynomials
+Checks whether F(x) = Σ seeds[i] * x^i (optionally mod a modulus) is injective on
+a domain [0, size), up to the full Unicode range:
+- Domain evaluated in chunks with a column-wise Horner kernel (C-level maps)
+- Collisions found with hashed buckets: outputs are split by y mod passes and each
+  pass keeps only its own bucket, so memory is bounded by BUCKET_CAPACITY entries
+- Seed sets analyzed in parallel, reporting the offending seeds and inputs
+- Non-negative integer keys are proved injective without evaluation (F is strictly
+  increasing on x >= 0), which makes the check cheap enough for key generation
+"""
+
+import os
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, repeat
+from operator import add, mod, mul
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# --------------------------------------------------
+# Constants
+# --------------------------------------------------
+
+UNICODE_DOMAIN_SIZE = 0x110000
+CHUNK_SIZE = 1 << 16  # Inputs evaluated per kernel call
+BUCKET_CAPACITY = 1 << 18  # Outputs held in memory per pass
+DEFAULT_LIMIT = 10  # Collisions reported per seed set
+
+Collision = Tuple[int, int, int]  # (first x, colliding x, shared output y)
+
+# --------------------------------------------------
+# Evaluation Kernel
+# --------------------------------------------------
+
+def evaluate_chunk(seeds: Sequence[int], start: int, stop: int, modulus: Optional[int] = None) -> List[int]:
+    """
+    [F(x) for x in range(start, stop)], evaluated column-wise in Horner form.
+    """
+    xs = range(start, stop)
+    n = len(xs)
+    coefs = list(seeds)[::-1]
+    acc = [coefs[0] % modulus if modulus else coefs[0]] * n
+    for coef in coefs[1:]:
+        acc = map(add, map(mul, acc, xs), repeat(coef, n))
+        acc = list(map(mod, acc, repeat(modulus, n)) if modulus else acc)
+    return acc
+
+def iter_output_chunks(seeds: Sequence[int], size: int, modulus: Optional[int] = None,
+                       chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[int, List[int]]]:
+    """
+    Yields (start, outputs) for consecutive chunks of [0, size).
+    """
+    for start in range(0, size, chunk_size):
+        yield start, evaluate_chunk(seeds, start, min(start + chunk_size, size), modulus)
+
+def is_monotone_key(seeds: Sequence[int]) -> bool:
+    """
+    True when F is strictly increasing on x >= 0: no negative coefficient and some
+    non-constant one positive. Such keys are injective on every domain [0, size).
+    """
+    return all(s >= 0 for s in seeds) and any(s > 0 for s in seeds[1:])
+
+# --------------------------------------------------
+# Collision Search
+# --------------------------------------------------
+
+def find_collisions(seeds: Sequence[int], size: int = UNICODE_DOMAIN_SIZE, modulus: Optional[int] = None,
+                    limit: int = DEFAULT_LIMIT, chunk_size: int = CHUNK_SIZE,
+                    bucket_capacity: int = BUCKET_CAPACITY) -> List[Collision]:
+    """
+    Up to `limit` collisions (x1, x2, y) with x1 < x2 and F(x1) == F(x2) == y.
+    The domain is re-evaluated once per pass; each pass keeps only the outputs with
+    y mod passes equal to the pass number.
+    """
+    if modulus is None and is_monotone_key(seeds):
+        return []
+    passes = max(1, -(-size // bucket_capacity))
+    collisions = []
+    for bucket in range(passes):
+        seen: Dict[int, int] = {}
+        for start, ys in iter_output_chunks(seeds, size, modulus, chunk_size):
+            xs = range(start, start + len(ys))
+            if passes > 1:
+                flags = list(map(bucket.__eq__, map(mod, ys, repeat(passes))))
+                ys, xs = list(compress(ys, flags)), list(compress(xs, flags))
+            for y, x in zip(ys, xs):
+                first = seen.setdefault(y, x)
+                if first != x:
+                    collisions.append((first, x, y))
+            if len(collisions) >= limit:
+                return sorted(collisions)[:limit]
+    return sorted(collisions)[:limit]
+
+def is_injective(seeds: Sequence[int], size: int, modulus: Optional[int] = None) -> bool:
+    """
+    Pre-flight check for key generation: stops at the first collision.
+    """
+    return not find_collisions(seeds, size, modulus, limit=1)
+
+# --------------------------------------------------
+# Parallel Seed-Set Analysis
+# --------------------------------------------------
+
+def _analyze_task(task: Tuple[Tuple[int, ...], int, Optional[int], int]) -> Dict[str, object]:
+    seeds, size, modulus, limit = task
+    collisions = find_collisions(seeds, size, modulus, limit)
+    return {
+        'seeds': list(seeds),
+        'injective': not collisions,
+        'proved': modulus is None and is_monotone_key(seeds),
+        'collisions': collisions,
+    }
+
+def analyze_seed_sets(seed_sets: Sequence[Sequence[int]], size: int = UNICODE_DOMAIN_SIZE,
+                      modulus: Optional[int] = None, limit: int = DEFAULT_LIMIT,
+                      workers: Optional[int] = None) -> Dict[str, object]:
+    """
+    Analyzes every seed set over [0, size) in a process pool. Returns a summary with
+    the per-set reports of the non-injective ones.
+    """
+    tasks = [(tuple(seeds), size, modulus, limit) for seeds in seed_sets]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(_analyze_task, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+    else:
+        reports = list(map(_analyze_task, tasks))
+    offending = [r for r in reports if not r['injective']]
+    return {
+        'seed_sets': len(reports),
+        'domain_size': size,
+        'modulus': modulus,
+        'injective': len(reports) - len(offending),
+        'proved_without_evaluation': sum(r['proved'] for r in reports),
+        'offending': offending,
+    }
+
+def random_seed_sets(count: int, degree: int = 3, bit_length: int = 16,
+                     modulus: Optional[int] = None) -> List[List[int]]:
+    bound = modulus if modulus else (1 << bit_length) - 1
+    return [[secrets.randbelow(bound) for _ in range(degree + 1)] for _ in range(count)]
+
+# --------------------------------------------------
+# Example
+# --------------------------------------------------
+
+def main():
+    report = analyze_seed_sets(random_seed_sets(1000), UNICODE_DOMAIN_SIZE)
+    print("=== INTEGER KEYS OVER THE UNICODE DOMAIN ===")
+    print(f"Injective: {report['injective']}/{report['seed_sets']} "
+          f"(proved without evaluation: {report['proved_without_evaluation']})")
+
+    modulus = 65521
+    report = analyze_seed_sets(random_seed_sets(32, modulus=modulus), 4096, modulus)
+    print(f"\n=== MODULAR KEYS (mod {modulus}) OVER [0, 4096) ===")
+    print(f"Injective: {report['injective']}/{report['seed_sets']}")
+    for r in report['offending'][:5]:
+        x1, x2, y = r['collisions'][0]
+        print(f"seeds={r['seeds']}: F({x1}) == F({x2}) == {y}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Residue-Class Precomputation for the Division-Free Generators
+Shared layer used by the method_* modules:
+- Admissible residue classes of multipliers for i*L + c progressions (Method 1)
+- Periodic residues of base^p mod d and the exponents they forbid (Methods 2 and 3)
+- Residues of prime-power products and sums, so candidates are screened with
+  small-int table lookups instead of trial division of the full big integer
+Results are cached per canonical divisor set.
+"""
+
+from functools import lru_cache
+from itertools import compress, count as count_from
+from math import gcd, lcm
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, Tuple
+
+import profiling
+
+# --------------------------------------------------
+# Divisor Sets
+# --------------------------------------------------
+
+def canonical_divisors(divisors: Iterable[int]) -> Tuple[int, ...]:
+    """
+    Canonical cache key for a divisor set: sorted, without duplicates.
+    """
+    return tuple(sorted(set(divisors)))
+
+# --------------------------------------------------
+# Power Cycles
+# --------------------------------------------------
+
+@lru_cache(maxsize=None)
+def power_cycle(base: int, d: int) -> Tuple[Tuple[int, ...], int]:
+    """
+    Residues of base^p mod d for p = 1, 2, ... until the first repeat.
+    Returns (residues, tail_start): residues[tail_start:] repeats forever.
+    """
+    seen: Dict[int, int] = {}
+    residues = []
+    r = base % d
+    while r not in seen:
+        seen[r] = len(residues)
+        residues.append(r)
+        r = r * base % d
+    return tuple(residues), seen[r]
+
+# --------------------------------------------------
+# Offset ± base^p Schedules (Method 2)
+# --------------------------------------------------
+
+@lru_cache(maxsize=1024)
+def forbidden_exponent_classes(divisors: Tuple[int, ...], base: int, offset_residues: Tuple[int, ...],
+                               sign: int) -> Tuple[Tuple[int, int, FrozenSet[int]], ...]:
+    """
+    For values offset + sign*base^p, returns one (tail_start, period, forbidden) entry per
+    divisor that can divide some value; forbidden holds indices p-1 into its power cycle.
+    Divisors that never divide any value are dropped, so an empty result means every
+    exponent is admissible. |offset - base^p| has the same divisibility as offset - base^p.
+    """
+    constraints = []
+    for d, off in zip(divisors, offset_residues):
+        residues, tail_start = power_cycle(base, d)
+        forbidden = frozenset(i for i, r in enumerate(residues) if (off + sign * r) % d == 0)
+        if forbidden:
+            constraints.append((tail_start, len(residues) - tail_start, forbidden))
+    return tuple(constraints)
+
+def exponent_filter(divisors: Iterable[int], base: int, offset: int, sign: int) -> Callable[[int], bool]:
+    """
+    Returns a predicate telling whether offset + sign*base^p avoids every divisor.
+    """
+    key = canonical_divisors(divisors)
+    constraints = forbidden_exponent_classes(key, base, tuple(offset % d for d in key), sign)
+    if not constraints:
+        return lambda p: True
+
+    def admissible(p: int) -> bool:
+        i = p - 1
+        for tail_start, period, forbidden in constraints:
+            j = i if i < tail_start else tail_start + (i - tail_start) % period
+            if j in forbidden:
+                return False
+        return True
+    return admissible
+
+EXPONENT_WINDOW = 1 << 12  # Exponents sieved per window
+
+def exponent_period(divisors: Iterable[int], base: int, offset: int, sign: int) -> Tuple[int, int]:
+    """
+    (pre_period, period) of the admissible-exponent pattern: for p > pre_period,
+    p is admissible exactly when p + period is. period is the LCM of the power-cycle
+    lengths (multiplicative orders, for invertible bases) of the constraining divisors.
+    """
+    key = canonical_divisors(divisors)
+    constraints = forbidden_exponent_classes(key, base, tuple(offset % d for d in key), sign)
+    if not constraints:
+        return 0, 1
+    return max(t for t, _, _ in constraints), lcm(*(q for _, q, _ in constraints))
+
+def admissible_exponents(divisors: Iterable[int], base: int, offset: int, sign: int,
+                         start: int = 1, window: int = EXPONENT_WINDOW) -> Iterator[int]:
+    """
+    Lazily yields every exponent p >= start with offset + sign*base^p avoiding all divisors.
+    Exponents are sieved in windows: each forbidden class of a divisor's power cycle is
+    struck with one slice, so rejected exponents are never visited. Stops once a whole
+    combined period passes without an admissible exponent (none can follow).
+    """
+    key = canonical_divisors(divisors)
+    constraints = forbidden_exponent_classes(key, base, tuple(offset % d for d in key), sign)
+    pre_period, period = exponent_period(key, base, offset, sign)
+    last_hit = start - 1  # index i = p - 1 below the first candidate
+    for lo in count_from(start - 1, window):
+        if lo - last_hit > pre_period + period:
+            return
+        flags = bytearray(b'\x01') * window
+        for tail_start, cycle, forbidden in constraints:
+            for j in forbidden:
+                if j < tail_start:  # pre-periodic index: forbids the single exponent j + 1
+                    if lo <= j < lo + window:
+                        flags[j - lo] = 0
+                    continue
+                first = j - lo if j >= lo else (j - lo) % cycle
+                if first < window:
+                    flags[first::cycle] = bytes(len(range(first, window, cycle)))
+        for i in compress(range(lo, lo + window), flags):
+            last_hit = i
+            yield i + 1
+
+# --------------------------------------------------
+# i*L + c Progressions (Method 1)
+# --------------------------------------------------
+
+@lru_cache(maxsize=256)
+def progression_strike_classes(divisors: Tuple[int, ...], L: int,
+                               offsets: Tuple[Tuple[int, int], ...]) -> Tuple[Tuple[int, int], ...]:
+    """
+    For multipliers i of parity `parity` paired with offset c (offsets holds
+    (parity, c) pairs), returns the (residue, modulus) classes of i for which
+    i*L + c is divisible by some d. Solves i*L ≡ -c (mod d) jointly with the parity of i.
+    """
+    classes = set()
+    for parity, c in offsets:
+        for d in divisors:
+            g = gcd(L, d)
+            if c % g:
+                continue
+            m = d // g
+            # Particular solution of (L/g)*i ≡ -c/g (mod m)
+            t = (-(c // g) * pow(L // g, -1, m)) % m if m > 1 else 0
+            modulus = lcm(2, m)
+            for r in (t, t + m):
+                if r % 2 == parity:
+                    classes.add((r % modulus, modulus))
+                    break
+    return tuple(sorted(classes))
+
+# --------------------------------------------------
+# Product / Sum Residues (Method 3)
+# --------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def prime_power_residues(p: int, k: int, divisors: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    p^k mod d for every d in the (canonical) divisor tuple.
+    """
+    return tuple(pow(p, k, d) for d in divisors)
+
+def product_residues(factors: Iterable[Tuple[int, int]], divisors: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Residues of Π p^k over (p, k) factors, combined from cached prime-power residues.
+    """
+    acc = [1 % d for d in divisors]
+    for p, k in factors:
+        acc = [a * r % d for a, r, d in zip(acc, prime_power_residues(p, k, divisors), divisors)]
+    return tuple(acc)
+
+def sum_avoids_divisors(left: Tuple[int, ...], right: Tuple[int, ...], divisors: Tuple[int, ...]) -> bool:
+    """
+    True when left + right is divisible by no d, given both terms' residues.
+    """
+    return all((a + b) % d for a, b, d in zip(left, right, divisors))
+
+# --------------------------------------------------
+# Cache Statistics
+# --------------------------------------------------
+
+def residue_cache_info() -> Dict[str, Dict[str, int]]:
+    caches = {
+        'power_cycle': power_cycle,
+        'forbidden_exponent_classes': forbidden_exponent_classes,
+        'progression_strike_classes': progression_strike_classes,
+        'prime_power_residues': prime_power_residues,
+    }
+    stats = {}
+    for name, fn in caches.items():
+        info = fn.cache_info()
+        stats[name] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize}
+    return stats
+
+profiling.register_source('residue_caches', residue_cache_info)
@@ -4,9 +4,16 @@ Implements the first method described in the paper:
 "A Division-Free Constructive Framework for Number Generation under Divisibility Constraints"
 """
 
+from itertools import compress, count as count_from, islice
 from math import gcd, lcm
-from typing import List, Set
+from typing import Iterator, List, Set
 
+import profiling
+from divisor_residues import canonical_divisors, progression_strike_classes
+
+SIEVE_BLOCK_SIZE = 1 << 16  # Multipliers i marked per sieve segment
+
+@profiling.timed('method_1.generate')
 def method1_lcm_offset_odd_only(divisors: List[int], count: int) -> List[int]:
     L = lcm(*divisors)
     results = []
@@ -21,8 +28,42 @@ def method1_lcm_offset_odd_only(divisors: List[int], count: int) -> List[int]:
         if all(val % d != 0 for d in divisors) and val % 2 == 1:
             results.append(val)
         i += 1
+    profiling.record_counts('method_1', tested=i - 1, accepted=len(results))
     return results
 
+# --------------------------------------------------
+# Segmented Sieve Engine
+# --------------------------------------------------
+
+def iter_method1_values(divisors: List[int], block_size: int = SIEVE_BLOCK_SIZE,
+                        start_multiplier: int = 1) -> Iterator[int]:
+    """
+    Lazily yields the same sequence as method1_lcm_offset_odd_only, without end,
+    beginning at multiplier i = start_multiplier.
+    Multipliers are sieved in segments of block_size: every divisor strikes its
+    residue classes with slice assignment, so memory stays bounded by the segment.
+    """
+    L = lcm(*divisors)
+    # Odd i carries offset 2, even i offset 1; 2 is struck too so results stay odd
+    strikes = progression_strike_classes(canonical_divisors(list(divisors) + [2]), L, ((1, 2), (0, 1)))
+    period = lcm(*(m for _, m in strikes))
+    if all(any(i % m == r for r, m in strikes) for i in range(period)):
+        raise ValueError(f"No value of the form i*L + {{1, 2}} avoids divisors {divisors}.")
+    for start in count_from(start_multiplier, block_size):
+        mask = bytearray(b'\x01') * block_size
+        for r, m in strikes:
+            first = (r - start) % m
+            if first < block_size:
+                mask[first::m] = bytes(len(range(first, block_size, m)))
+        if profiling.is_enabled():
+            profiling.record_counts('method_1.sieve', blocks=1, tested=block_size, accepted=mask.count(1))
+        for i in compress(range(start, start + block_size), mask):
+            yield i * L + 1 + (i & 1)
+
+def method1_lcm_offset_odd_only_sieved(divisors: List[int], count: int,
+                                       block_size: int = SIEVE_BLOCK_SIZE) -> List[int]:
+    return list(islice(iter_method1_values(divisors, block_size), count))
+
 
 # Example usage
 if __name__ == "__main__":
@@ -4,64 +4,92 @@ Implements the second method described in the paper:
 "A Division-Free Constructive Framework for Number Generation under Divisibility Constraints"
 """
 
+import heapq
+from itertools import islice
 from math import gcd, lcm
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
-def method_lcm_power_offset(divisors: List[int], count: int, base: int = 2) -> Tuple[List[int], List[Tuple[int, str]], float]:
+import profiling
+from bulk_validate import validate_bulk
+from divisor_residues import admissible_exponents
+
+MAX_POWER = 100  # Exponent cap of the paper's reference loop
+
+# --------------------------------------------------
+# Exponent Scheduler
+# --------------------------------------------------
+
+def iter_lcm_power_offset(divisors: List[int], base: int = 2, max_power: Optional[int] = None,
+                          start: Tuple[int, str] = (1, '+')) -> Iterator[Tuple[int, str, int]]:
+    """
+    Lazily yields (p, op, value) for every valid LCM ± base^p with p ascending and
+    '+' before '-', from position `start` up to max_power (without end when None).
+    Only exponents admissible from the periodic residues of base^p mod d are visited,
+    and base^p advances from the previous scheduled exponent by one multiplication.
+    """
     L = lcm(*divisors)
+    start_p, start_op = start
+    schedules = [((p, '+') for p in admissible_exponents(divisors, base, L, 1, start=start_p + (start_op == '-'))),
+                 ((p, '-') for p in admissible_exponents(divisors, base, L, -1, start=start_p))]
+    step_powers: Dict[int, int] = {0: 1}
+    p_prev, power = start_p - 1, base ** (start_p - 1)
+    for p, op in heapq.merge(*schedules):
+        if max_power is not None and p > max_power:
+            return
+        gap = p - p_prev
+        if gap not in step_powers:
+            step_powers[gap] = base ** gap
+        power *= step_powers[gap]
+        p_prev = p
+        yield p, op, L + power if op == '+' else abs(L - power)
+
+@profiling.timed('method_2.generate')
+def method_lcm_power_offset(divisors: List[int], count: int, base: int = 2,
+                            max_power: Optional[int] = MAX_POWER) -> Tuple[List[int], List[Tuple[int, str]], float]:
+    """
+    The first `count` values of LCM ± base^p for p in [1, max_power] (no cap when None).
+    The success rate counts the (p, op) positions up to the last value taken, as the
+    paper's loop tests every one of them.
+    """
     results = []
     combinations = []
-    valid = 0
-    total_tested = 0
-    
-    max_power = 100 # Safety limit to prevent infinite loops
-    power_range = range(1, max_power + 1)
-    
-    for p in power_range:
-        if len(results) >= count:
-            break
-        
-        # Test both addition and subtraction
-        for op in ['+', '-']:
-            if op == '+':
-                val = L + (base ** p)
-            else:
-                val = abs(L - (base ** p))  # Absolute value to keep positive
-                
-            total_tested += 1
-            if all(val % d != 0 for d in divisors):
-                valid += 1
-                results.append(val)
-                combinations.append((val, f"LCM{divisors} {op} {base}^{p}"))
-                
-                if len(results) >= count:
-                    break
-    
+    last_p, last_op = 0, '-'
+    for p, op, val in islice(iter_lcm_power_offset(divisors, base, max_power), count):
+        results.append(val)
+        combinations.append((val, f"LCM{divisors} {op} {base}^{p}"))
+        last_p, last_op = p, op
+    if len(results) < count and max_power is not None:
+        last_p, last_op = max_power, '-'
+    total_tested = 2 * last_p - (last_op == '+')
+    valid = len(results)
     success_rate = (valid / total_tested) * 100 if total_tested > 0 else 0
-    
+    profiling.record_counts('method_2', tested=total_tested, accepted=valid)
     return results, combinations, success_rate
 
 def validate_results(results: List[int], divisors: List[int]) -> Tuple[int, float]:
-    errors = [n for n in results if any(n % d == 0 for d in divisors)]
-    error_percent = (len(errors) / len(results)) * 100 if results else 0
-    return len(errors), error_percent
+    report = validate_bulk(results, divisors)
+    return report['errors'], report['error_rate']
 
 # Example usage
-divisors = [3, 5, 7,11,13,17,19,23,29,31,37,41,43,47]
-count = 1000
+def main():
+    divisors = [3, 5, 7,11,13,17,19,23,29,31,37,41,43,47]
+    count = 1000
+
+    numbers, comb_descriptions, success_rate = method_lcm_power_offset(divisors, count, max_power=None)
+    error_count, error_percent = validate_results(numbers, divisors)
 
-numbers, comb_descriptions, success_rate = method_lcm_power_offset(divisors, count)
-error_count, error_percent = validate_results(numbers, divisors)
+    print("Generated Numbers (LCM ± 2^p):")
+    for i, (num, desc) in enumerate(zip(numbers, comb_descriptions), 1):
+        print(f"{i}. {desc} = {num}")
 
-print("Generated Numbers (LCM ± 2^p):")
-for i, (num, desc) in enumerate(zip(numbers, comb_descriptions), 1):
-    print(f"{i}. {desc} = {num}")
+    print(f"\nSuccess Rate: {success_rate:.2f}% of tested combinations were valid")
+    print(f"Validation: {error_count} errors ({error_percent:.2f}%) in final results")
 
-print(f"\nSuccess Rate: {success_rate:.2f}% of tested combinations were valid")
-print(f"Validation: {error_count} errors ({error_percent:.2f}%) in final results")
+    print("\nStatistics:")
+    print(f"Total generated: {len(numbers)}")
+    print(f"Minimum: {min(numbers)}")
+    print(f"Maximum: {max(numbers)}")
+    print(f"Average: {sum(numbers)/len(numbers):.2f}")
 
-print("\nStatistics:")
-print(f"Total generated: {len(numbers)}")
-print(f"Minimum: {min(numbers)}")
-print(f"Maximum: {max(numbers)}")
-print(f"Average: {sum(numbers)/len(numbers):.2f}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,153 @@ Implements the second method described in the paper:
 "A Division-Free Constructive Framework for Number Generation under Divisibility Constraints"
 """
 
+import os
+import json
 from math import gcd
 from functools import reduce
-from typing import List, Tuple
-from sympy import primerange
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import profiling
+from bulk_validate import validate_bulk
+from divisor_residues import exponent_filter
+from prime_sieve import primerange
 
 # Custom LCM for multiple integers
 def lcm(*numbers: int) -> int:
     return reduce(lambda x, y: x * y // gcd(x, y), numbers)
 
+def _finish_stats(stats: dict) -> dict:
+    """
+    Fills in success_rate and publishes the tested/accepted counts to the profiler.
+    """
+    stats['success_rate'] = (stats['valid'] / stats['tested']) * 100
+    profiling.record_counts('method_2_1', tested=stats['tested'], accepted=stats['valid'],
+                            added=stats['added'], subtracted=stats['subtracted'])
+    return stats
+
+# --------------------------------------------------
+# Resumable Generation (Checkpointed)
+# --------------------------------------------------
+
+CHECKPOINT_EVERY = 1000  # Values yielded between checkpoint writes
+
+def load_checkpoint(path: str) -> Optional[Dict[str, object]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_checkpoint(path: str, state: Dict[str, object]) -> None:
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+def _prime_power_table(prime: int, max_prime_power: int) -> List[int]:
+    """
+    [prime^1, ..., prime^max_prime_power], each entry one multiplication from the last.
+    """
+    table = [prime]
+    for _ in range(max_prime_power - 1):
+        table.append(table[-1] * prime)
+    return table
+
+def _iter_positions(main_divisors: List[int], clean_primes: List[int], max_power: int, max_prime_power: int,
+                    resume: Tuple[int, int, int, int] = (1, 0, 1, 0)) -> Iterator[Tuple[int, int, int, int, int]]:
+    """
+    (power, prime_index, exponent, sign, value) for every valid value of the
+    (power, prime, exponent, sign) loop nest, in loop order, from position `resume` on.
+    Each (prime, exponent, sign) is screened with the cached periodic residues of
+    prime^b mod d; 2^a * LCM is doubled per power and prime^b is read from per-prime tables.
+    """
+    prime_powers = [_prime_power_table(prime, max_prime_power) for prime in clean_primes]
+    start_power, start_prime, start_exp, start_sign = resume
+    lcm_multiple = lcm(*main_divisors) << start_power
+    for power in range(start_power, max_power + 1):
+        for prime_index in range(start_prime, len(clean_primes)):
+            prime = clean_primes[prime_index]
+            filters = (exponent_filter(main_divisors, prime, lcm_multiple, 1),
+                       exponent_filter(main_divisors, prime, lcm_multiple, -1))
+            for p_exp in range(start_exp, max_prime_power + 1):
+                prime_power = prime_powers[prime_index][p_exp - 1]
+                for sign in range(start_sign, 2):
+                    if filters[sign](p_exp):
+                        value = lcm_multiple + prime_power if sign == 0 else lcm_multiple - prime_power
+                        yield power, prime_index, p_exp, sign, value
+                start_sign = 0
+            start_exp = 1
+        start_prime = 0
+        lcm_multiple <<= 1
+
+def _formula(main_divisors: List[int], power: int, prime: int, p_exp: int, sign: int, value: int) -> str:
+    return f"(2^{power}×LCM{main_divisors}) {'+-'[sign]} {prime}^{p_exp} = {value}"
+
+def iter_enhanced_lcm_method(
+    main_divisors: List[int],
+    extra_primes: List[int],
+    max_power: int = 10,
+    max_prime_power: int = 5,
+    checkpoint: Optional[str] = None,
+    checkpoint_every: int = CHECKPOINT_EVERY
+) -> Iterator[Tuple[int, str]]:
+    """
+    Lazily yields the (value, formula) pairs of enhanced_lcm_method in the same order.
+
+    With a checkpoint path, the position in the (power, prime, exponent, sign) loop nest
+    is written there every `checkpoint_every` values, when the generator is closed and
+    when it is exhausted; a later call with the same parameters continues from it.
+    After a hard crash, values yielded since the last write are produced again.
+    """
+    clean_primes = [p for p in extra_primes if p not in main_divisors]
+    params = {'main_divisors': list(main_divisors), 'extra_primes': list(extra_primes),
+              'max_power': max_power, 'max_prime_power': max_prime_power}
+    state = {'params': params, 'power': 1, 'prime_index': 0, 'exponent': 1, 'sign': 0,
+             'emitted': 0, 'done': False}
+    saved = load_checkpoint(checkpoint) if checkpoint else None
+    if saved is not None:
+        if saved['params'] != params:
+            raise ValueError(f"Checkpoint {checkpoint} was written for different parameters.")
+        state.update(saved)
+    if state['done']:
+        return
+
+    resume = (state['power'], state['prime_index'], state['exponent'], state['sign'])
+    since_save = 0
+    try:
+        for power, prime_index, p_exp, sign, value in _iter_positions(
+                main_divisors, clean_primes, max_power, max_prime_power, resume):
+            # Written before the position moves past this value, so a crash
+            # while the consumer handles it produces it again on resume
+            if checkpoint and since_save >= checkpoint_every:
+                save_checkpoint(checkpoint, state)
+                since_save = 0
+            state.update(power=power, prime_index=prime_index, exponent=p_exp, sign=sign + 1)
+            state['emitted'] += 1
+            since_save += 1
+            yield value, _formula(main_divisors, power, clean_primes[prime_index], p_exp, sign, value)
+        state['done'] = True
+    finally:
+        if checkpoint:
+            save_checkpoint(checkpoint, state)
+
+def iter_enhanced_lcm_values(main_divisors: List[int], extra_primes: List[int], max_power: int = 10,
+                             max_prime_power: int = 5,
+                             resume: Tuple[int, int, int, int] = (1, 0, 1, 0)) -> Iterator[Tuple[int, Tuple[int, int, int, int]]]:
+    """
+    Yields (value, position) for the values of iter_enhanced_lcm_method without their
+    formulas, from position `resume` on; passing a yielded position back as `resume`
+    continues right after that value.
+    """
+    clean_primes = [p for p in extra_primes if p not in main_divisors]
+    for power, prime_index, p_exp, sign, value in _iter_positions(
+            main_divisors, clean_primes, max_power, max_prime_power, resume):
+        yield value, (power, prime_index, p_exp, sign + 1)
+
+# --------------------------------------------------
+# List Interface
+# --------------------------------------------------
+
+@profiling.timed('method_2_1.generate')
 def enhanced_lcm_method(
     main_divisors: List[int],
     extra_primes: List[int],
@@ -23,8 +161,9 @@ def enhanced_lcm_method(
     """
     Generates numbers using:
     (2^a * LCM(main_divisors)) ± (prime^b), where b ∈ [1, max_prime_power]
+    Like the paper's loop, it stops after the (a, prime, b) step that reaches `count`,
+    and its stats cover every step up to there.
     """
-    L = lcm(*main_divisors)
     results = []
     formulas = []
     stats = {
@@ -39,93 +178,69 @@ def enhanced_lcm_method(
     # Ensure extra primes aren't in main divisors
     clean_primes = [p for p in extra_primes if p not in main_divisors]
 
-    for power in range(1, max_power + 1):
-        lcm_multiple = (2 ** power) * L
-        for prime in clean_primes:
-            for p_exp in range(1, max_prime_power + 1):
-                prime_power = prime ** p_exp
-
-                stats['tested'] += 2  # Test both + and -
-
-                # Addition case
-                val_add = lcm_multiple + prime_power
-                if all(val_add % d != 0 for d in main_divisors):
-                    results.append(val_add)
-                    formulas.append(
-                        f"(2^{power}×LCM{main_divisors}) + {prime}^{p_exp} = {val_add}"
-                    )
-                    stats['valid'] += 1
-                    stats['added'] += 1
-                    stats['min_power'] = min(stats['min_power'], power)
-                    stats['max_power'] = max(stats['max_power'], power)
-
-                # Subtraction case (negative results allowed)
-                val_sub = lcm_multiple - prime_power
-                if all(val_sub % d != 0 for d in main_divisors):
-                    results.append(val_sub)
-                    formulas.append(
-                        f"(2^{power}×LCM{main_divisors}) - {prime}^{p_exp} = {val_sub}"
-                    )
-                    stats['valid'] += 1
-                    stats['subtracted'] += 1
-                    stats['min_power'] = min(stats['min_power'], power)
-                    stats['max_power'] = max(stats['max_power'], power)
-
-                if len(results) >= count:
-                    stats['success_rate'] = (stats['valid'] / stats['tested']) * 100
-                    return results[:count], formulas[:count], stats
-
-    stats['success_rate'] = (stats['valid'] / stats['tested']) * 100
-    return results, formulas, stats
+    step = None
+    for power, prime_index, p_exp, sign, value in _iter_positions(
+            main_divisors, clean_primes, max_power, max_prime_power):
+        if (power, prime_index, p_exp) != step and step is not None and len(results) >= count:
+            break
+        step = (power, prime_index, p_exp)
+        results.append(value)
+        formulas.append(_formula(main_divisors, power, clean_primes[prime_index], p_exp, sign, value))
+        stats['valid'] += 1
+        stats['added' if sign == 0 else 'subtracted'] += 1
+        stats['min_power'] = min(stats['min_power'], power)
+        stats['max_power'] = max(stats['max_power'], power)
+
+    if len(results) >= count:
+        power, prime_index, p_exp = step
+        steps = ((power - 1) * len(clean_primes) + prime_index) * max_prime_power + p_exp
+    else:
+        steps = max_power * len(clean_primes) * max_prime_power
+    stats['tested'] = 2 * steps  # Both + and - per step
+    return results[:count], formulas[:count], _finish_stats(stats)
 
 def validate_results(results: List[int], divisors: List[int]) -> dict:
-    error_indices = []
-    for i, num in enumerate(results):
-        if any(num % d == 0 for d in divisors):
-            error_indices.append(i)
-
-    return {
-        'total': len(results),
-        'errors': len(error_indices),
-        'error_rate': (len(error_indices) / len(results)) * 100 if results else 0,
-        'error_indices': error_indices
-    }
+    return validate_bulk(results, divisors)
 
 # Example usage
-main_divisors = list(primerange(3, 20)) 
-extra_primes = list(primerange(21, 50))  # Primes <50 not in main divisors
-count = 1000
-
-numbers, formulas, gen_stats = enhanced_lcm_method(
-    main_divisors,
-    extra_primes,
-    count=count,
-    max_power=20,
-    max_prime_power=10
-)
-validation = validate_results(numbers, main_divisors)
-
-print("ENHANCED LCM METHOD RESULTS\n")
-print("Generated Numbers:")
-for i, formula in enumerate(formulas, 1):
-    print(f"{i}. {formula}")
-
-print("\nGeneration Statistics:")
-print(f"Tested combinations: {gen_stats['tested']}")
-print(f"Valid results found: {gen_stats['valid']}")
-print(f"Success rate: {gen_stats['success_rate']:.2f}%")
-print(f"Added cases: {gen_stats['added']}")
-print(f"Subtracted cases: {gen_stats['subtracted']}")
-print(f"Power of 2 range: {gen_stats['min_power']} to {gen_stats['max_power']}")
-
-print("\nValidation Results:")
-print(f"Total numbers: {validation['total']}")
-print(f"Invalid numbers: {validation['errors']}")
-print(f"Error rate: {validation['error_rate']:.2f}%")
-if validation['error_indices']:
-    print(f"Error positions: {validation['error_indices']}")
-
-print("\nNumber Statistics:")
-print(f"Minimum: {min(numbers)}")
-print(f"Maximum: {max(numbers)}")
-print(f"Average: {sum(numbers)/len(numbers):.2f}")
+def main():
+    main_divisors = list(primerange(3, 20)) 
+    extra_primes = list(primerange(21, 50))  # Primes <50 not in main divisors
+    count = 1000
+
+    numbers, formulas, gen_stats = enhanced_lcm_method(
+        main_divisors,
+        extra_primes,
+        count=count,
+        max_power=20,
+        max_prime_power=10
+    )
+    validation = validate_results(numbers, main_divisors)
+
+    print("ENHANCED LCM METHOD RESULTS\n")
+    print("Generated Numbers:")
+    for i, formula in enumerate(formulas, 1):
+        print(f"{i}. {formula}")
+
+    print("\nGeneration Statistics:")
+    print(f"Tested combinations: {gen_stats['tested']}")
+    print(f"Valid results found: {gen_stats['valid']}")
+    print(f"Success rate: {gen_stats['success_rate']:.2f}%")
+    print(f"Added cases: {gen_stats['added']}")
+    print(f"Subtracted cases: {gen_stats['subtracted']}")
+    print(f"Power of 2 range: {gen_stats['min_power']} to {gen_stats['max_power']}")
+
+    print("\nValidation Results:")
+    print(f"Total numbers: {validation['total']}")
+    print(f"Invalid numbers: {validation['errors']}")
+    print(f"Error rate: {validation['error_rate']:.2f}%")
+    if validation['error_indices']:
+        print(f"Error positions: {validation['error_indices']}")
+
+    print("\nNumber Statistics:")
+    print(f"Minimum: {min(numbers)}")
+    print(f"Maximum: {max(numbers)}")
+    print(f"Average: {sum(numbers)/len(numbers):.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -4,80 +4,172 @@ Implements the third method described in the paper:
 "A Division-Free Constructive Framework for Number Generation under Divisibility Constraints"
 """
 
-from itertools import combinations
-from typing import Set, List, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations, islice
+from typing import Iterator, Set, List, Tuple
 
-def generate_valid_combinations(D: Set[int], count: int = 10) -> Tuple[List[int], List[Tuple[str, str]]]:
-    results = []
-    comb_descriptions = []
-    primes_in_D = sorted(D)
-    powers_of_2 = [2**p for p in [1, 2, 3 ,4]]  # 2, 4, 8
-    
-    # Generate all possible partitions of primes in D
+import profiling
+from bulk_validate import validate_bulk
+from divisor_residues import canonical_divisors, product_residues, sum_avoids_divisors
+
+@lru_cache(maxsize=65536)
+def _subset_power_product(primes: Tuple[int, ...], k: int) -> int:
+    """
+    Memoized Π p^k over a subset of D.
+    """
+    value = 1
+    for p in primes:
+        value *= p**k
+    return value
+
+MAX_EXPONENT = 4  # Largest exponent of 2 and of the prime products in generate_valid_combinations
+
+def _partition_candidates(left_primes: Tuple[int, ...], right_primes: Tuple[int, ...],
+                          key: Tuple[int, ...], limit: int,
+                          max_exponent: int = MAX_EXPONENT) -> Tuple[List[Tuple[int, Tuple[str, str]]], int]:
+    """
+    Valid (total, description) pairs of one partition, in the serial search order,
+    stopping after `limit` results, and the number of candidates tested. Candidates
+    are accepted from their residues alone.
+    """
+    found = []
+    tested = 0
+    exponents_2 = range(1, max_exponent + 1)
+    powers = range(1, max_exponent + 1)
+
+    def with_two(res: Tuple[int, ...], two_res: Tuple[int, ...]) -> Tuple[int, ...]:
+        return tuple(a * b % d for a, b, d in zip(res, two_res, key))
+
+    sides = []
+    for primes in (left_primes, right_primes):
+        values = [_subset_power_product(primes, k) for k in powers]
+        residues = [product_residues([(p, k) for p in primes], key) for k in powers]
+        texts = ['*'.join(f'{p}^{k}' for p in primes) for k in powers]
+        sides.append((values, residues, texts))
+    (left_vals, left_res, left_txt), (right_vals, right_res, right_txt) = sides
+
+    # Case 1: 2 is in left term, then Case 2: 2 is in right term
+    for two_left in (True, False):
+        for e2 in exponents_2:
+            power_2 = 2**e2
+            two_res = product_residues([(2, e2)], key)
+            if two_left:
+                l_res = [with_two(res, two_res) for res in left_res]
+                r_res = right_res
+            else:
+                l_res = left_res
+                r_res = [with_two(res, two_res) for res in right_res]
+            for li in range(len(powers)):
+                for ri in range(len(powers)):
+                    tested += 1
+                    if not sum_avoids_divisors(l_res[li], r_res[ri], key):
+                        continue
+                    if two_left:
+                        found.append((power_2 * left_vals[li] + right_vals[ri],
+                                      (f"{power_2}*{left_txt[li]}", right_txt[ri])))
+                    else:
+                        found.append((left_vals[li] + power_2 * right_vals[ri],
+                                      (left_txt[li], f"{power_2}*{right_txt[ri]}")))
+                    if len(found) >= limit:
+                        return found, tested
+    return found, tested
+
+def _iter_partitions(primes_in_D: List[int]) -> Iterator[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
     for r in range(1, len(primes_in_D)):
         for left_primes in combinations(primes_in_D, r):
-            left_primes = list(left_primes)
-            right_primes = [p for p in primes_in_D if p not in left_primes]
-            
-            # Case 1: 2 is in left term (2^a * product(left_primes))
-            for power_2 in powers_of_2:
-                for left_power in [1, 2 , 3,4]:
-                    left_term = power_2
-                    for p in left_primes:
-                        left_term *= p**left_power
-                    
-                    for right_power in [1, 2 , 3,4]:
-                        right_term = 1
-                        for p in right_primes:
-                            right_term *= p**right_power
-                        
-                        total = left_term + right_term
-                        if all(total % d != 0 for d in D):
-                            results.append(total)
-                            desc = (f"{power_2}*{'*'.join(f'{p}^{left_power}' for p in left_primes)}", 
-                                    f"{'*'.join(f'{p}^{right_power}' for p in right_primes)}")
-                            comb_descriptions.append(desc)
-                            if len(results) >= count:
-                                return results, comb_descriptions
-            
-            # Case 2: 2 is in right term (product(left_primes) + 2^a*product(right_primes))
-            for power_2 in powers_of_2:
-                for left_power in [1, 2 ,3 ,4]:
-                    left_term = 1
-                    for p in left_primes:
-                        left_term *= p**left_power
-                    
-                    for right_power in [1, 2 ,3,4]:
-                        right_term = power_2
-                        for p in right_primes:
-                            right_term *= p**right_power
-                        
-                        total = left_term + right_term
-                        if all(total % d != 0 for d in D):
-                            results.append(total)
-                            desc = (f"{'*'.join(f'{p}^{left_power}' for p in left_primes)}", 
-                                    f"{power_2}*{'*'.join(f'{p}^{right_power}' for p in right_primes)}")
-                            comb_descriptions.append(desc)
-                            if len(results) >= count:
-                                return results, comb_descriptions
+            yield left_primes, tuple(p for p in primes_in_D if p not in left_primes)
+
+# --------------------------------------------------
+# Partition Search (Serial or Parallel)
+# --------------------------------------------------
+
+PARTITIONS_PER_TASK = 256
+
+def _partition_task(task: Tuple[Tuple[int, ...], List[Tuple[Tuple[int, ...], Tuple[int, ...]]], int, int]) -> Tuple[List[Tuple[int, Tuple[str, str]]], int]:
+    key, partitions, limit, max_exponent = task
+    found = []
+    tested = 0
+    for left_primes, right_primes in partitions:
+        more, n = _partition_candidates(left_primes, right_primes, key, limit - len(found), max_exponent)
+        found.extend(more)
+        tested += n
+        if len(found) >= limit:
+            break
+    return found, tested
+
+@profiling.timed('method_3.generate')
+def generate_valid_combinations(D: Set[int], count: int = 10, max_exponent: int = MAX_EXPONENT,
+                                workers: int = 1,
+                                partitions_per_task: int = PARTITIONS_PER_TASK) -> Tuple[List[int], List[Tuple[str, str]]]:
+    """
+    Sums 2^a*Π(left primes)^k + Π(right primes)^m (and with 2 on the right) over every
+    partition of D, accepting each candidate from cached prime-power residues alone.
+    max_exponent widens the paper's exponent lists [1..4]. With workers > 1, runs of
+    partitions are sharded across a process pool and merged strictly in submission
+    order, so the first `count` results match the serial run; remaining tasks are
+    cancelled once `count` is reached.
+    """
+    key = canonical_divisors(D)
+    partitions = _iter_partitions(sorted(D))
+    results = []
+    comb_descriptions = []
+    tested = 0
+
+    def take(found: List[Tuple[int, Tuple[str, str]]]) -> None:
+        for total, desc in found[:count - len(results)]:
+            results.append(total)
+            comb_descriptions.append(desc)
+
+    if workers <= 1:
+        for left_primes, right_primes in partitions:
+            found, n = _partition_candidates(left_primes, right_primes, key, count - len(results), max_exponent)
+            take(found)
+            tested += n
+            if len(results) >= count:
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            exhausted = False
+            while len(results) < count:
+                while not exhausted and len(pending) < 2 * workers:
+                    chunk = list(islice(partitions, partitions_per_task))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    pending.append(pool.submit(_partition_task, (key, chunk, count, max_exponent)))
+                if not pending:
+                    break
+                found, n = pending.popleft().result()
+                take(found)
+                tested += n
+            for fut in pending:
+                fut.cancel()
+    profiling.record_counts('method_3', tested=tested, accepted=len(results))
     return results, comb_descriptions
 
 def validate_results(results: List[int], D: Set[int]) -> Tuple[int, float]:
-    errors = [n for n in results if any(n % d == 0 for d in D)]
-    return len(errors), (len(errors)/len(results))*100 if results else 0
+    report = validate_bulk(results, D)
+    return report['errors'], report['error_rate']
 
 # Example usage
-D = {3, 5, 7 , 11 , 13 , 17 , 19 , 23 , 29}
-numbers, descriptions = generate_valid_combinations(D, count=10000)
+def main():
+    D = {3, 5, 7 , 11 , 13 , 17 , 19 , 23 , 29}
+    numbers, descriptions = generate_valid_combinations(D, count=10000)
+
+    print("Valid Combinations:")
+    for i, (num, (left, right)) in enumerate(zip(numbers, descriptions), 1):
+        print(f"{i}. {left} + {right} = {num}")
 
-print("Valid Combinations:")
-for i, (num, (left, right)) in enumerate(zip(numbers, descriptions), 1):
-    print(f"{i}. {left} + {right} = {num}")
+    error_count, error_percent = validate_results(numbers, D)
+    print(f"\nValidation: {error_count} errors ({error_percent:.2f}%)")
 
-error_count, error_percent = validate_results(numbers, D)
-print(f"\nValidation: {error_count} errors ({error_percent:.2f}%)")
+    print("\nStatistics:")
+    print(f"Generated: {len(numbers)} numbers")
+    print(f"Min: {min(numbers)}, Max: {max(numbers)}")
+    print(f"Average: {sum(numbers)/len(numbers):.2f}")
 
-print("\nStatistics:")
-print(f"Generated: {len(numbers)} numbers")
-print(f"Min: {min(numbers)}, Max: {max(numbers)}")
-print(f"Average: {sum(numbers)/len(numbers):.2f}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -4,55 +4,243 @@ Implements the third method described in the paper:
 "A Division-Free Constructive Framework for Number Generation under Divisibility Constraints"
 """
 
+import heapq
+from array import array
+from itertools import islice, tee
 from math import gcd
-from typing import Set, List
-
-def is_valid_combination(a1: int, p1: int, a2: int, p2: int, P1: int, P2: int, divisors: Set[int]) -> bool:
-    x1 = (a1 * p1) ** P1
-    x2 = (a2 * p2) ** P2
-    total = x1 + x2
-
-    return (
-        p1 not in divisors and  # p₁ ∉ D
-        p2 not in divisors and  # p₂ ∉ D
-        gcd(a1 * p1, a2 * p2) == 1 and  # Terms are coprime
-        ((a1 * p1) % 2 == 0 or (a2 * p2) % 2 == 0) and  # One term is even
-        all(total % d != 0 for d in divisors)  # Sum avoids all d ∈ D
-    )
-
-def generate_method3_values(divisors: Set[int], count: int = 10) -> List[int]:
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import profiling
+from bulk_validate import validate_bulk
+from divisor_residues import canonical_divisors, prime_power_residues, sum_avoids_divisors
+from prime_sieve import iter_primes
+
+@profiling.timed('method_3_1.generate')
+def generate_method3_values(divisors: Set[int], count: int = 10, prime_limit: int = 100) -> List[int]:
+    """
+    Distinct sums (a1*p1)^P1 + (a2*p2)^P2 with p1, p2 ∉ D, coprime terms of which one
+    is even, avoiding every d in D; the first `count` found in the paper's loop order,
+    sorted. Pair-level conditions are checked once per (a1, p1, a2, p2) and the sum is
+    screened from cached residues of (a*p)^P mod d, so powers are only computed for
+    accepted combinations. Primes p < prime_limit come from the shared wheel sieve.
+    """
     results = set()
-    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
-    allowed_primes = [p for p in primes if p not in divisors]  # Primes not in D
+    tested = 0
+    key = canonical_divisors(divisors)
+    allowed_primes = [p for p in iter_primes(2, prime_limit) if p not in divisors]
+    multipliers = [1, 2, 3, 4, 5, 6]
+    exponents = [1, 2, 3, 4, 5, 6]
 
-    # Generate combinations systematically
-    for a1 in [1, 2, 3, 4,5,6]:  # Small multipliers
-        for a2 in [1, 2, 3, 4,5,6]:
+    for a1 in multipliers:
+        for a2 in multipliers:
             for p1 in allowed_primes:
                 for p2 in allowed_primes:
-                    if p1 == p2:  # Ensure terms are coprime
+                    if p1 == p2:
+                        continue
+                    t1, t2 = a1 * p1, a2 * p2
+                    if gcd(t1, t2) != 1 or (t1 % 2 != 0 and t2 % 2 != 0):
                         continue
-                    for P1 in [1, 2, 3 , 4 ,5 ,6 ]:  # Small exponents
-                        for P2 in [1, 2, 3 , 4 ,5 ,6 ]:
-                            if is_valid_combination(a1, p1, a2, p2, P1, P2, divisors):
-                                x1 = (a1 * p1) ** P1
-                                x2 = (a2 * p2) ** P2
-                                results.add(x1 + x2)
+                    res2 = [prime_power_residues(t2, P2, key) for P2 in exponents]
+                    for P1 in exponents:
+                        res1 = prime_power_residues(t1, P1, key)
+                        for P2, r2 in zip(exponents, res2):
+                            tested += 1
+                            if sum_avoids_divisors(res1, r2, key):
+                                results.add(t1 ** P1 + t2 ** P2)
                                 if len(results) >= count:
+                                    profiling.record_counts('method_3_1', tested=tested, accepted=len(results))
                                     return sorted(results)
+    profiling.record_counts('method_3_1', tested=tested, accepted=len(results))
     return sorted(results)
 
+# --------------------------------------------------
+# Pruned Sorted Enumeration Engine
+# --------------------------------------------------
+
+METHOD3_MULTIPLIERS = [1, 2, 3, 4, 5, 6]
+METHOD3_EXPONENTS = [1, 2, 3, 4, 5, 6]
+TERM_SEGMENT_TURNS = 1 << 6  # Wheel turns per sieve segment of the term stream
+
+class _PartnerTable:
+    """
+    Ascending terms t = a*p pulled on demand from a term source, and per first term t1
+    the list of its partners t2 > t1 coprime to t1, not both odd, each stored as a term
+    index with a non-zero bitmask of the exponent index pairs (k1, k2), bit
+    k1*len(exponents) + k2, whose sum avoids D. Pair-level checks run once per (t1, t2),
+    when a partner list is extended; admissible depends only on the residues of t1 and
+    t2 mod D, so it is cached per pair of distinct residue rows.
+    """
+
+    def __init__(self, terms: Iterator[int], exponents: List[int], key: Tuple[int, ...]):
+        self.source = terms
+        self.exponents = exponents
+        self.key = key
+        self.terms: List[int] = []
+        self.rows: List[int] = []  # Index of each term's residue row
+        self.row_index: Dict[Tuple[int, ...], int] = {}
+        self.row_needs: List[List[Tuple[int, ...]]] = []  # [k] -> -t^P_k mod each d
+        self.row_masks: List[List[List[int]]] = []  # [d index][r] -> bits k with t^P_k ≢ r (mod d)
+        self.pair_cache: Dict[Tuple[int, int], int] = {}
+        self.partners: Dict[int, Tuple[array, array]] = {}  # i -> (term indices, admissible masks)
+        self.cursors: Dict[int, int] = {}
+
+    def has_term(self, i: int) -> bool:
+        while len(self.terms) <= i:
+            t = next(self.source, None)
+            if t is None:
+                return False
+            row = tuple(t % d for d in self.key)
+            if row not in self.row_index:
+                self.row_index[row] = len(self.row_needs)
+                residues = [prime_power_residues(t, P, self.key) for P in self.exponents]
+                full = (1 << len(self.exponents)) - 1
+                masks = [[full] * d for d in self.key]
+                for k, res in enumerate(residues):
+                    for di, r in enumerate(res):
+                        masks[di][r] &= ~(1 << k)
+                self.row_needs.append([tuple(-r % d for r, d in zip(res, self.key)) for res in residues])
+                self.row_masks.append(masks)
+            self.terms.append(t)
+            self.rows.append(self.row_index[row])
+        return True
+
+    def admissible(self, row1: int, row2: int) -> int:
+        pair = (row1, row2)
+        ok = self.pair_cache.get(pair)
+        if ok is None:
+            n = len(self.exponents)
+            full = (1 << n) - 1
+            masks2 = self.row_masks[row2]
+            ok = 0
+            for k1, needs in enumerate(self.row_needs[row1]):
+                allowed = full
+                for masks, r in zip(masks2, needs):
+                    allowed &= masks[r]
+                ok |= allowed << (k1 * n)
+            self.pair_cache[pair] = ok
+        return ok
+
+    def partner(self, i: int, pos: int) -> Optional[Tuple[int, int]]:
+        """
+        (t2, admissible) of the pos-th partner of term i, extending its list as needed.
+        """
+        if i not in self.partners:
+            self.partners[i] = (array('q'), array('q'))
+        indices, masks = self.partners[i]
+        j = self.cursors.get(i, i + 1)
+        t1, row1 = self.terms[i], self.rows[i]
+        while len(indices) <= pos:
+            if not self.has_term(j):
+                self.cursors[i] = j
+                return None
+            t2 = self.terms[j]
+            if (t1 % 2 == 0 or t2 % 2 == 0) and gcd(t1, t2) == 1:
+                ok = self.admissible(row1, self.rows[j])
+                if ok:
+                    indices.append(j)
+                    masks.append(ok)
+            j += 1
+        self.cursors[i] = j
+        return self.terms[indices[pos]], masks[pos]
+
+def _iter_terms(divisors: Set[int], prime_limit: Optional[int], multipliers: List[int]) -> Iterator[int]:
+    """
+    Distinct terms a*p with p ∉ D, p < prime_limit (unbounded when None), ascending.
+    One lazy prime stream in small sieve segments is shared by every multiplier, so
+    only the primes between the slowest and fastest multiplier's position are held.
+    """
+    primes = (p for p in iter_primes(2, prime_limit, TERM_SEGMENT_TURNS) if p not in divisors)
+    multipliers = sorted(set(multipliers))
+    streams = [map(a.__mul__, stream) for a, stream in zip(multipliers, tee(primes, len(multipliers)))]
+    last = None
+    for t in heapq.merge(*streams):
+        if t != last:
+            last = t
+            yield t
+
+def iter_method3_values(divisors: Set[int], prime_limit: Optional[int] = 100,
+                        multipliers: List[int] = METHOD3_MULTIPLIERS,
+                        exponents: List[int] = METHOD3_EXPONENTS) -> Iterator[int]:
+    """
+    Lazily yields every distinct value of generate_method3_values' search space over
+    primes p < prime_limit in ascending order; with prime_limit=None, without end.
+
+    Terms t = a*p are deduplicated and (t1, t2) is treated as unordered (t1 < t2), since
+    swapping the terms gives the same value set. Each (t1, P1, P2) is a run over t1's
+    partner list, increasing in t2; t1 pairs with no admissible (P1, P2) never enter it.
+    Runs wait in a heap keyed by their lower bound t1^P1 + t1^P2 and are opened only when
+    the output reaches it. Terms come from the segmented prime sieve as the output needs
+    them, so terms, residues and partner lists grow with the output, not the search space.
+    """
+    key = canonical_divisors(divisors)
+    exponents = sorted(set(exponents))
+    table = _PartnerTable(_iter_terms(divisors, prime_limit, multipliers), exponents, key)
+    active: List[Tuple[int, int, int, int, int]] = []  # (value, i, k1, k2, partner position)
+    pending: List[Tuple[int, int, int, int]] = []  # (lower bound, i, k1, k2)
+    admitted = opened = 0
+
+    def advance(i: int, k1: int, k2: int, pos: int) -> None:
+        base = table.terms[i] ** exponents[k1]
+        bit = 1 << (k1 * len(exponents) + k2)
+        while True:
+            entry = table.partner(i, pos)
+            if entry is None:
+                return
+            t2, ok = entry
+            if ok & bit:
+                heapq.heappush(active, (base + t2 ** exponents[k2], i, k1, k2, pos))
+                return
+            pos += 1
+
+    last = None
+    try:
+        while True:
+            admit_at = 2 * table.terms[admitted] ** exponents[0] if table.has_term(admitted) else None
+            pending_at = pending[0][0] if pending else None
+            active_at = active[0][0] if active else None
+            bounds = [b for b in (admit_at, pending_at) if b is not None]
+            if active_at is None and not bounds:
+                return
+            if bounds and (active_at is None or min(bounds) <= active_at):
+                if admit_at is not None and admit_at == min(bounds):
+                    t = table.terms[admitted]
+                    for k1, P1 in enumerate(exponents):
+                        for k2, P2 in enumerate(exponents):
+                            heapq.heappush(pending, (t ** P1 + t ** P2, admitted, k1, k2))
+                    admitted += 1
+                else:
+                    _, i, k1, k2 = heapq.heappop(pending)
+                    opened += 1
+                    advance(i, k1, k2, 0)
+                continue
+            value, i, k1, k2, pos = heapq.heappop(active)
+            if value != last:
+                last = value
+                yield value
+            advance(i, k1, k2, pos + 1)
+    finally:
+        profiling.record_counts('method_3_1.sorted', terms=admitted, runs=opened)
+
+def generate_method3_values_sorted(divisors: Set[int], count: int = 10,
+                                   prime_limit: Optional[int] = 100) -> List[int]:
+    """
+    The `count` smallest values of the search space over primes p < prime_limit
+    (any prime when None). It equals generate_method3_values whenever count covers
+    the whole space; otherwise that function returns the first values found in loop
+    order rather than the smallest.
+    """
+    return list(islice(iter_method3_values(divisors, prime_limit), count))
+
 def validate_results(results: List[int], divisors: Set[int]) -> float:
-    error_count = 0
-    for num in results:
-        if any(num % d == 0 for d in divisors):
-            error_count += 1
-    error_percent = (error_count / len(results)) * 100 if results else 0
-    return error_percent
+    return validate_bulk(results, divisors)['error_rate']
 
 # Example Usage
-D = {3, 5, 7 , 11,13,17}
-results = generate_method3_values(D, count=100000)
-error_percent = validate_results(results, D)
-print(f"Generated {len(results)} numbers. Error rate: {error_percent:.2f}%")
-print("Sample results:", results[:100])
\ No newline at end of file
+def main():
+    D = {3, 5, 7 , 11,13,17}
+    results = generate_method3_values(D, count=100000)
+    error_percent = validate_results(results, D)
+    print(f"Generated {len(results)} numbers. Error rate: {error_percent:.2f}%")
+    print("Sample results:", results[:100])
+
+if __name__ == "__main__":
+    main()
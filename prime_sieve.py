@@ -0,0 +1,111 @@
+"""
+Prime Sieve
+In-house replacement for sympy.primerange used by the generator scripts,
+so importing them does not pull in sympy. Also provides the lazy prime source
+shared by the generators:
+- Segmented sieve on a 2·3·5·7 wheel: segments hold odd numbers only and start
+  from a pre-struck pattern of the multiples of 3, 5 and 7, over any range
+No generator draws candidates coprime to D (method_1 sieves multipliers of i*L + c,
+method_3_1 needs terms coprime to each other and primes outside D), so there is no
+coprime-candidate stream here.
+"""
+
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import compress
+from math import isqrt
+from typing import Iterator, List, Optional, Tuple
+
+# --------------------------------------------------
+# Constants
+# --------------------------------------------------
+
+WHEEL_PRIMES = (2, 3, 5, 7)
+WHEEL = 210
+SEGMENT_TURNS = 1 << 12  # Wheel turns per segment (860,160 integers, 430 KiB of flags)
+
+# --------------------------------------------------
+# Simple Sieve
+# --------------------------------------------------
+
+def primes_below(n: int) -> List[int]:
+    """
+    Sieve of Eratosthenes over odd numbers: all primes p < n.
+    """
+    if n <= 2:
+        return []
+    sieve = bytearray(b'\x01') * (n // 2)  # index i stands for 2*i + 1
+    sieve[0] = 0
+    for i in range(1, (isqrt(n - 1) - 1) // 2 + 1):
+        if sieve[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            sieve[start::p] = bytes(len(range(start, len(sieve), p)))
+    return [2] + list(compress(range(1, n, 2), sieve))
+
+def primerange(a: int, b: int) -> List[int]:
+    """
+    Primes p with a <= p < b, matching sympy.primerange(a, b).
+    """
+    return list(iter_primes(a, b))
+
+# --------------------------------------------------
+# Segmented Wheel Sieve
+# --------------------------------------------------
+
+def _wheel_pattern() -> bytes:
+    """
+    One wheel turn of odd-number flags (index i stands for 2*i + 1) with the
+    multiples of 3, 5 and 7 already struck.
+    """
+    flags = bytearray(b'\x01') * (WHEEL // 2)
+    for p in WHEEL_PRIMES[1:]:
+        flags[p // 2::p] = bytes(len(range(p // 2, WHEEL // 2, p)))
+    return bytes(flags)
+
+_PATTERN = _wheel_pattern()
+
+@lru_cache(maxsize=32)
+def _sieving_primes(limit: int) -> Tuple[int, ...]:
+    """
+    Primes 7 < p < limit; limit is a power of two so segments share cache entries.
+    """
+    return tuple(p for p in primes_below(limit) if p > WHEEL_PRIMES[-1])
+
+def _wheel_segment(turn: int, turns: int) -> List[int]:
+    """
+    Primes in [turn*WHEEL, (turn + turns)*WHEEL) other than 2, 3, 5, 7, ascending.
+    Odd numbers only; the segment starts from the repeated wheel pattern, so only
+    primes above 7 are struck, each with one strided slice assignment.
+    """
+    lo = turn * WHEEL
+    hi = lo + turns * WHEEL
+    flags = bytearray(_PATTERN * turns)  # index i stands for lo + 2*i + 1
+    for p in _sieving_primes(1 << isqrt(hi - 1).bit_length()):
+        if p * p >= hi:
+            break
+        m = max(p * p, -(-lo // p) * p)
+        if m % 2 == 0:
+            m += p
+        first = (m - lo) // 2
+        flags[first::p] = bytes(len(range(first, len(flags), p)))
+    if turn == 0:
+        flags[0] = 0  # 1 is not prime
+    return list(compress(range(lo + 1, hi, 2), flags))
+
+def iter_primes(start: int = 2, stop: Optional[int] = None, segment_turns: int = SEGMENT_TURNS) -> Iterator[int]:
+    """
+    Lazily yields the primes p with start <= p < stop (without end when stop is None).
+    Memory is bounded by one segment plus the sieving primes up to sqrt(p).
+    """
+    for p in WHEEL_PRIMES:
+        if p >= start and (stop is None or p < stop):
+            yield p
+    turn = max(start, 0) // WHEEL
+    while stop is None or turn * WHEEL < stop:
+        turns = segment_turns if stop is None else min(segment_turns, -(-(stop - turn * WHEEL) // WHEEL))
+        values = _wheel_segment(turn, turns)
+        lo = bisect_left(values, start)
+        hi = bisect_left(values, stop) if stop is not None else len(values)
+        yield from values[lo:hi]
+        turn += turns
@@ -0,0 +1,134 @@
+"""
+Hot-Path Profiling Hooks
+Opt-in instrumentation shared by the crypto and generator modules:
+- Named counters (e.g. candidates tested vs accepted per generator)
+- Per-phase timers (table builds, keyfile JSON I/O, encrypt/decrypt passes)
+- Snapshot sources: modules register callables (cache statistics) that are
+  sampled when a snapshot is taken
+Disabled by default; while disabled every hook returns after a single flag check.
+"""
+
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Callable, Dict, TypeVar
+
+F = TypeVar('F', bound=Callable)
+
+_enabled = False
+_counters: Dict[str, int] = defaultdict(int)
+_phases: Dict[str, Dict[str, float]] = {}
+_sources: Dict[str, Callable[[], object]] = {}
+
+# --------------------------------------------------
+# Switches
+# --------------------------------------------------
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+def is_enabled() -> bool:
+    return _enabled
+
+def reset() -> None:
+    _counters.clear()
+    _phases.clear()
+
+# --------------------------------------------------
+# Counters
+# --------------------------------------------------
+
+def count(name: str, n: int = 1) -> None:
+    if _enabled:
+        _counters[name] += n
+
+def record_counts(scope: str, **counts: int) -> None:
+    """
+    Adds several counters under one scope, e.g. record_counts('method_2', tested=200, accepted=190).
+    """
+    if _enabled:
+        for name, n in counts.items():
+            _counters[f"{scope}.{name}"] += n
+
+# --------------------------------------------------
+# Phase Timers
+# --------------------------------------------------
+
+def _add_phase(name: str, seconds: float) -> None:
+    stats = _phases.get(name)
+    if stats is None:
+        stats = _phases[name] = {'calls': 0, 'total_s': 0.0, 'max_s': 0.0}
+    stats['calls'] += 1
+    stats['total_s'] += seconds
+    if seconds > stats['max_s']:
+        stats['max_s'] = seconds
+
+class _Phase:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> '_Phase':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _add_phase(self.name, time.perf_counter() - self.start)
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullPhase':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+_NULL_PHASE = _NullPhase()
+
+def phase(name: str):
+    """
+    Context manager timing a block as one call of phase `name`.
+    """
+    return _Phase(name) if _enabled else _NULL_PHASE
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorator timing every call of the wrapped function as phase `name`.
+    """
+    def decorate(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _add_phase(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+# --------------------------------------------------
+# Snapshots
+# --------------------------------------------------
+
+def register_source(name: str, fn: Callable[[], object]) -> None:
+    """
+    Registers a callable whose result is included in every snapshot.
+    """
+    _sources[name] = fn
+
+def snapshot() -> Dict[str, object]:
+    return {
+        'enabled': _enabled,
+        'counters': dict(_counters),
+        'phases': {name: dict(stats) for name, stats in _phases.items()},
+        'sources': {name: fn() for name, fn in _sources.items()},
+    }
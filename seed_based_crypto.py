@@ -8,21 +8,118 @@ Author: Amer Alaa Eldin Attia Gomaa
 Date: May 2025
 """
 
+import sys
 import secrets
 import json
-from typing import Dict, List, Callable
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Callable, Iterable, Optional, Sequence, Tuple, Union
+
+import profiling
+from collision_analyzer import is_injective
+
+# --------------------------------------------------
+# Constants
+# --------------------------------------------------
+
+ASCII_DOMAIN_SIZE = 128
+BYTE_DOMAIN_SIZE = 256
 
 # --------------------------------------------------
 # Polynomial Generator
 # --------------------------------------------------
 
+class Polynomial:
+    """
+    Reusable polynomial key F(x) = Σ seeds[i] * x^i evaluated in Horner form.
+    Forward and inverse domain tables are built once per domain size and kept.
+    """
+    __slots__ = ('seeds', '_coefs', '_tables', '_inverses', '_planes')
+
+    def __init__(self, seeds: Iterable[int]):
+        self.seeds = tuple(seeds)
+        self._coefs = self.seeds[::-1]
+        self._tables: Dict[int, List[int]] = {}
+        self._inverses: Dict[int, Dict[int, int]] = {}
+        self._planes: Optional[BytePlanes] = None
+
+    def __call__(self, x: int) -> int:
+        acc = 0
+        for coef in self._coefs:
+            acc = acc * x + coef
+        return acc
+
+    def __repr__(self) -> str:
+        return f"Polynomial({list(self.seeds)})"
+
+    def forward_table(self, size: int = ASCII_DOMAIN_SIZE) -> List[int]:
+        table = self._tables.get(size)
+        if table is None:
+            table = self._tables[size] = build_forward_table(self, size)
+        return table
+
+    def inverse_table(self, size: int = ASCII_DOMAIN_SIZE) -> Dict[int, int]:
+        inverse = self._inverses.get(size)
+        if inverse is None:
+            inverse = self._inverses[size] = build_inverse_table(self.forward_table(size))
+        return inverse
+
+    def encrypt(self, message: Union[str, bytes, bytearray, memoryview], size: int = ASCII_DOMAIN_SIZE) -> List[int]:
+        return encrypt_message_batch(message, self.forward_table(size))
+
+    def decrypt(self, cipher: Iterable[int], size: int = ASCII_DOMAIN_SIZE) -> str:
+        return decrypt_message_batch(cipher, self.inverse_table(size))
+
+    def byte_planes(self) -> 'BytePlanes':
+        if self._planes is None:
+            self._planes = build_byte_planes(self.forward_table(BYTE_DOMAIN_SIZE))
+        return self._planes
+
+    def encrypt_bytes(self, data: Union[str, 'BytesLike']) -> array:
+        return encrypt_bytes(data, self.byte_planes())
+
+    def decrypt_bytes(self, cipher: Sequence[int]) -> bytes:
+        return decrypt_bytes(cipher, self.inverse_table(BYTE_DOMAIN_SIZE))
+
 def generate_polynomial_function(seeds: List[int]) -> Callable[[int], int]:
     """
     Constructs a polynomial function F(x) = Σ seeds[i] * x^i.
     """
-    def F(x: int) -> int:
-        return sum(coef * (x ** i) for i, coef in enumerate(seeds))
-    return F
+    return Polynomial(seeds)
+
+# --------------------------------------------------
+# Polynomial Key Cache
+# --------------------------------------------------
+
+POLYNOMIAL_CACHE_SIZE = 128
+
+def _make_polynomial_cache(maxsize: int) -> Callable[[Tuple[int, ...]], Polynomial]:
+    return lru_cache(maxsize=maxsize)(Polynomial)
+
+_polynomial_cache = _make_polynomial_cache(POLYNOMIAL_CACHE_SIZE)
+
+def get_polynomial(seeds: Iterable[int]) -> Polynomial:
+    """
+    Returns the cached Polynomial for a seed tuple, building it on first use.
+    Tables built on a cached key are reused by every later caller with the same seeds.
+    """
+    return _polynomial_cache(tuple(seeds))
+
+def polynomial_cache_info() -> Dict[str, int]:
+    info = _polynomial_cache.cache_info()
+    return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+
+def resize_polynomial_cache(maxsize: int) -> None:
+    """
+    Replaces the key cache with an empty one holding at most maxsize keys.
+    """
+    global _polynomial_cache
+    _polynomial_cache = _make_polynomial_cache(maxsize)
+
+def clear_polynomial_cache() -> None:
+    _polynomial_cache.cache_clear()
+
+profiling.register_source('polynomial_cache', polynomial_cache_info)
 
 # --------------------------------------------------
 # Inverse Function (Lookup Table)
@@ -49,26 +146,260 @@ def encrypt_message(message: str, func: Callable[[int], int]) -> List[int]:
 def decrypt_message(cipher: List[int], inv_func: Callable[[int], int]) -> str:
     return ''.join(chr(inv_func(c)) for c in cipher)
 
+# --------------------------------------------------
+# Batch Encryption (Precomputed Table)
+# --------------------------------------------------
+
+@profiling.timed('crypto.build_forward_table')
+def build_forward_table(func: Callable[[int], int], size: int = ASCII_DOMAIN_SIZE) -> List[int]:
+    """
+    Precomputes F(x) for x in [0, size) so that table[x] == func(x).
+    """
+    return [func(i) for i in range(size)]
+
+@profiling.timed('crypto.encrypt_batch')
+def encrypt_message_batch(message: Union[str, bytes, bytearray, memoryview], table: List[int]) -> List[int]:
+    """
+    Encrypts a whole message by gathering from a precomputed forward table.
+    Produces exactly the same words as encrypt_message for codes inside the table.
+    """
+    if isinstance(message, str):
+        try:
+            codes = message.encode('latin-1')
+        except UnicodeEncodeError:
+            codes = list(map(ord, message))
+    else:
+        codes = message
+    profiling.count('crypto.encrypt_words', len(codes))
+    try:
+        return list(map(table.__getitem__, codes))
+    except IndexError:
+        raise ValueError(f"Encryption failed: character code outside table domain [0, {len(table)}).") from None
+
+# --------------------------------------------------
+# Batch Decryption (Bulk Inverse Table)
+# --------------------------------------------------
+
+@profiling.timed('crypto.build_inverse_table')
+def build_inverse_table(table: List[int]) -> Dict[int, int]:
+    """
+    Inverts a forward table into a {F(x): x} map used for bulk lookups.
+    """
+    return {y: x for x, y in enumerate(table)}
+
+def invert_cipher_batch(cipher: Iterable[int], inverse: Dict[int, int]) -> Tuple[List[Optional[int]], List[int]]:
+    """
+    Inverts a whole ciphertext in one pass without raising.
+    Returns (codes, error_indices) where undecodable words map to None in codes.
+    """
+    codes = list(map(inverse.get, cipher))
+    if None not in codes:
+        return codes, []
+    return codes, [i for i, c in enumerate(codes) if c is None]
+
+@profiling.timed('crypto.decrypt_batch')
+def decrypt_message_batch(cipher: Iterable[int], inverse: Dict[int, int]) -> str:
+    """
+    Bulk counterpart of decrypt_message. All undecodable words are reported together.
+    """
+    codes, errors = invert_cipher_batch(cipher, inverse)
+    profiling.count('crypto.decrypt_words', len(codes))
+    if errors:
+        shown = ', '.join(map(str, errors[:10])) + (', ...' if len(errors) > 10 else '')
+        raise ValueError(f"Decryption failed: {len(errors)} word(s) not found in map at positions [{shown}].")
+    try:
+        return bytes(codes).decode('latin-1')
+    except ValueError:  # codes beyond the byte domain
+        return ''.join(map(chr, codes))
+
+# --------------------------------------------------
+# Bytes Mode (Byte-Plane Tables)
+# --------------------------------------------------
+
+# Fixed word widths (bytes) mapped to unsigned array typecodes of that exact size
+WORD_TYPECODES: Dict[int, str] = {}
+for _typecode in 'BHILQ':
+    WORD_TYPECODES.setdefault(array(_typecode).itemsize, _typecode)
+
+BYTES_BLOCK = 1 << 15  # Input bytes translated per pass, sized to stay cache-resident
+BytePlanes = Tuple[int, List[bytes]]  # (word width, one 256-byte translation table per word byte)
+BytesLike = Union[bytes, bytearray, memoryview, array]
+
+@profiling.timed('crypto.build_byte_planes')
+def build_byte_planes(table: List[int]) -> BytePlanes:
+    """
+    Splits a 256-entry forward table into per-byte translation tables: plane k maps
+    x to byte k (little-endian) of F(x). The width is the smallest fixed word size
+    holding every word.
+    """
+    if len(table) != BYTE_DOMAIN_SIZE or min(table) < 0:
+        raise ValueError(f"Bytes mode needs {BYTE_DOMAIN_SIZE} non-negative table words.")
+    bits = max(table).bit_length()
+    width = next((w for w in sorted(WORD_TYPECODES) if bits <= 8 * w), None)
+    if width is None:
+        raise ValueError(f"Cipher words need {bits} bits; bytes mode holds at most 64 (use a modular key).")
+    return width, [bytes((y >> (8 * k)) & 0xFF for y in table) for k in range(width)]
+
+@profiling.timed('crypto.encrypt_bytes')
+def encrypt_bytes_into(data: BytesLike, planes: BytePlanes, out: bytearray, offset: int = 0) -> int:
+    """
+    Writes the little-endian cipher word of every input byte into a preallocated
+    buffer, starting at word `offset`. Each word byte is one bytes.translate pass and
+    one strided slice assignment per input block, so nothing is built per byte.
+    Returns the number of words written.
+    """
+    width, tables = planes
+    is_view = not isinstance(data, (bytes, bytearray))
+    if is_view:
+        data = memoryview(data).cast('B')
+    n = len(data)
+    start, stop = offset * width, (offset + n) * width
+    if stop > len(out):
+        raise ValueError(f"Output buffer holds {len(out) // width} words, need {offset + n}.")
+    for pos in range(0, n, BYTES_BLOCK):
+        block = data[pos:pos + BYTES_BLOCK]
+        if is_view:
+            block = block.tobytes()  # Only one block of a buffer is copied at a time
+        base = start + pos * width
+        end = base + len(block) * width
+        for k, plane in enumerate(tables):
+            out[base + k:end:width] = block.translate(plane)
+    profiling.count('crypto.encrypt_bytes', n)
+    return n
+
+def encrypt_bytes(data: Union[str, BytesLike], planes: BytePlanes) -> array:
+    """
+    Encrypts raw bytes (str is encoded as UTF-8) into an array of cipher words in
+    native byte order, so result[i] == F(data[i]).
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    width = planes[0]
+    buf = bytearray(memoryview(data).nbytes * width)
+    encrypt_bytes_into(data, planes, buf)
+    words = array(WORD_TYPECODES[width])
+    words.frombytes(buf)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words
+
+@profiling.timed('crypto.decrypt_bytes')
+def decrypt_bytes(cipher: Sequence[int], inverse: Dict[int, int]) -> bytes:
+    """
+    Inverse of encrypt_bytes over a 256-entry inverse table. Decode UTF-8 text with
+    .decode('utf-8'). All undecodable words are reported together.
+    """
+    try:
+        return bytes(map(inverse.__getitem__, cipher))
+    except KeyError:
+        errors = invert_cipher_batch(cipher, inverse)[1]
+        shown = ', '.join(map(str, errors[:10])) + (', ...' if len(errors) > 10 else '')
+        raise ValueError(f"Decryption failed: {len(errors)} word(s) not found in map at positions [{shown}].") from None
+
 # --------------------------------------------------
 # Seed Management
 # --------------------------------------------------
 
-def generate_seeds(degree: int = 3, bit_length: int = 16) -> List[int]:
+MAX_SEED_DRAWS = 1000  # Redraws allowed before key generation gives up
+
+def generate_seeds(degree: int = 3, bit_length: int = 16, domain_size: int = ASCII_DOMAIN_SIZE) -> List[int]:
+    """
+    Random seeds, redrawn in the rare case F collides on [0, domain_size).
+    Raises ValueError when no injective key can be drawn with these parameters.
+    """
     max_val = (1 << bit_length) - 1
-    return [secrets.randbelow(max_val) for _ in range(degree + 1)]
+    if domain_size > 1 and (degree < 1 or max_val < 2):
+        raise ValueError(f"No injective key on [0, {domain_size}) with degree={degree}, "
+                         f"bit_length={bit_length}: needs degree >= 1 and bit_length >= 2.")
+    for _ in range(MAX_SEED_DRAWS):
+        seeds = [secrets.randbelow(max_val) for _ in range(degree + 1)]
+        if is_injective(seeds, domain_size):
+            return seeds
+    raise ValueError(f"No injective key on [0, {domain_size}) found in {MAX_SEED_DRAWS} draws.")
 
-def save_keyfile(seeds: List[int], cipher: List[int], filename: str = "keyfile.json") -> None:
+@profiling.timed('crypto.save_keyfile')
+def save_keyfile(seeds: List[int], cipher: List[int], filename: str = "keyfile.json",
+                 modulus: Optional[int] = None) -> None:
     data = {
         "seeds": seeds,
-        "cipher": cipher
+        "cipher": list(cipher)
     }
+    if modulus is not None:
+        data["modulus"] = modulus
     with open(filename, 'w') as f:
         json.dump(data, f)
 
+@profiling.timed('crypto.load_keyfile')
 def load_keyfile(filename: str = "keyfile.json") -> Dict[str, List[int]]:
     with open(filename, 'r') as f:
         return json.load(f)
 
+# --------------------------------------------------
+# Modular Mode (Fixed-Width Cipher Words)
+# --------------------------------------------------
+
+MODULAR_PRIME = 2**31 - 1  # Mersenne prime: every cipher word fits in uint32
+
+def word_typecode(modulus: int) -> str:
+    """
+    Smallest unsigned array typecode holding every residue mod modulus.
+    """
+    for typecode in 'IQ':
+        if modulus <= 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise ValueError(f"Modulus {modulus} does not fit in 64-bit cipher words.")
+
+class ModularPolynomial(Polynomial):
+    """
+    F(x) = Σ seeds[i] * x^i mod modulus. Cipher words are bounded by the modulus,
+    so ciphertexts are fixed-width unsigned arrays instead of unbounded ints.
+    """
+    __slots__ = ('modulus', 'typecode')
+
+    def __init__(self, seeds: Iterable[int], modulus: int = MODULAR_PRIME):
+        super().__init__(seeds)
+        self.modulus = modulus
+        self.typecode = word_typecode(modulus)
+
+    def __call__(self, x: int) -> int:
+        acc = 0
+        for coef in self._coefs:
+            acc = (acc * x + coef) % self.modulus
+        return acc
+
+    def __repr__(self) -> str:
+        return f"ModularPolynomial({list(self.seeds)}, modulus={self.modulus})"
+
+    def is_injective(self, size: int = BYTE_DOMAIN_SIZE) -> bool:
+        return len(self.inverse_table(size)) == size
+
+    def encrypt(self, message: Union[str, bytes, bytearray, memoryview], size: int = BYTE_DOMAIN_SIZE) -> array:
+        return array(self.typecode, encrypt_message_batch(message, self.forward_table(size)))
+
+    def decrypt(self, cipher: Iterable[int], size: int = BYTE_DOMAIN_SIZE) -> str:
+        return decrypt_message_batch(cipher, self.inverse_table(size))
+
+def generate_modular_seeds(degree: int = 3, modulus: int = MODULAR_PRIME,
+                           size: int = BYTE_DOMAIN_SIZE) -> List[int]:
+    """
+    Draws seeds in [0, modulus) until F mod modulus is injective on [0, size), so
+    every byte maps to a distinct cipher word. Raises ValueError when no such key
+    can exist or none is found in MAX_SEED_DRAWS draws.
+    """
+    if size > 1 and (degree < 1 or modulus < size):
+        raise ValueError(f"No injective key on [0, {size}) with degree={degree}, modulus={modulus}: "
+                         f"needs degree >= 1 and modulus >= {size}.")
+    for _ in range(MAX_SEED_DRAWS):
+        seeds = [secrets.randbelow(modulus) for _ in range(degree + 1)]
+        if is_injective(seeds, size, modulus):
+            return seeds
+    raise ValueError(f"No injective key mod {modulus} on [0, {size}) found in {MAX_SEED_DRAWS} draws.")
+
+_modular_cache = lru_cache(maxsize=POLYNOMIAL_CACHE_SIZE)(ModularPolynomial)
+
+def get_modular_polynomial(seeds: Iterable[int], modulus: int = MODULAR_PRIME) -> ModularPolynomial:
+    return _modular_cache(tuple(seeds), modulus)
+
 # --------------------------------------------------
 # Full Encrypt/Decrypt Workflow
 # --------------------------------------------------
@@ -87,9 +418,10 @@ def decrypt_from_file(keyfile: str = "keyfile.json"):
     data = load_keyfile(keyfile)
     seeds = data["seeds"]
     cipher = data["cipher"]
-    enc_func = generate_polynomial_function(seeds)
-    dec_func = build_inverse_function(enc_func)
-    plaintext = decrypt_message(cipher, dec_func)
+    if "modulus" in data:
+        plaintext = get_modular_polynomial(seeds, data["modulus"]).decrypt(cipher)
+    else:
+        plaintext = get_polynomial(seeds).decrypt(cipher)
     print("✅ Decryption complete.")
     print("Encrypted:", cipher)
     print("Seeds:", seeds)
@@ -0,0 +1,257 @@
+"""
+Streaming Ciphertext Container for the Seed-Based Crypto Framework
+Implements:
+- Chunked file encryption/decryption with bounded memory
+- Compact binary container: header (seeds stored once), packed cipher words, chunk index
+- Backward-compatible decryption of legacy JSON keyfiles
+
+Container layout (all integers little-endian):
+    header   : magic 'SDC1' | version u8 | word width u8 (0 = varint) | reserved u16 | chunk size u32
+               | seed count u16 | seeds as varints
+    chunks   : plain length u32 | payload length u32 | packed words
+    index    : (chunk offset u64, plain length u32) per chunk
+    footer   : index offset u64 | chunk count u32 | magic 'SDC1'
+"""
+
+import sys
+import struct
+from array import array
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from seed_based_crypto import (
+    get_polynomial, get_modular_polynomial, encrypt_message_batch, encrypt_bytes_into, decrypt_bytes,
+    generate_seeds, load_keyfile, BYTE_DOMAIN_SIZE, WORD_TYPECODES
+)
+
+# --------------------------------------------------
+# Constants
+# --------------------------------------------------
+
+MAGIC = b'SDC1'
+VERSION = 1
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB of plaintext per chunk
+
+_HEADER = struct.Struct('<4sBBHI')
+_CHUNK = struct.Struct('<II')
+_INDEX_ENTRY = struct.Struct('<QI')
+_FOOTER = struct.Struct('<QI4s')
+
+# --------------------------------------------------
+# Word Packing
+# --------------------------------------------------
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _decode_varints(data: bytes, count: int, pos: int = 0) -> Tuple[List[int], int]:
+    values = []
+    for _ in range(count):
+        value = shift = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            value |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        values.append(value)
+    return values, pos
+
+def choose_word_width(table: List[int]) -> int:
+    """
+    Returns the smallest fixed width (1, 2, 4 or 8 bytes) that holds every word
+    of the table, or 0 when words need variable-length (varint) packing.
+    """
+    bits = max(table).bit_length() if table else 0
+    for width in sorted(WORD_TYPECODES):
+        if bits <= width * 8:
+            return width
+    return 0
+
+def pack_words(words: List[int], width: int) -> bytes:
+    if width == 0:
+        out = bytearray()
+        for w in words:
+            _encode_varint(w, out)
+        return bytes(out)
+    packed = array(WORD_TYPECODES[width], words)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+def unpack_words(payload: bytes, width: int, count: int) -> List[int]:
+    if width == 0:
+        return _decode_varints(payload, count)[0]
+    packed = array(WORD_TYPECODES[width])
+    packed.frombytes(payload)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tolist()
+
+# --------------------------------------------------
+# Header / Index
+# --------------------------------------------------
+
+def _write_header(dst: BinaryIO, seeds: List[int], width: int, chunk_size: int) -> None:
+    if any(s < 0 for s in seeds):
+        raise ValueError("Container format requires non-negative seeds.")
+    seed_bytes = bytearray()
+    for s in seeds:
+        _encode_varint(s, seed_bytes)
+    dst.write(_HEADER.pack(MAGIC, VERSION, width, 0, chunk_size))
+    dst.write(struct.pack('<H', len(seeds)))
+    dst.write(seed_bytes)
+
+def _read_exact(src: BinaryIO, size: int) -> bytes:
+    data = src.read(size)
+    if len(data) < size:
+        raise ValueError("Truncated container.")
+    return data
+
+def read_header(src: BinaryIO) -> Tuple[List[int], int, int]:
+    """
+    Reads the container header from the current position.
+    Returns (seeds, word_width, chunk_size).
+    """
+    magic, version, width, _, chunk_size = _HEADER.unpack(_read_exact(src, _HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a seed container file.")
+    if version != VERSION:
+        raise ValueError(f"Unsupported container version: {version}")
+    (n_seeds,) = struct.unpack('<H', _read_exact(src, 2))
+    seeds = []
+    for _ in range(n_seeds):
+        value = shift = 0
+        while True:
+            b = _read_exact(src, 1)[0]
+            value |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        seeds.append(value)
+    return seeds, width, chunk_size
+
+def read_index(src: BinaryIO) -> List[Tuple[int, int]]:
+    """
+    Reads the chunk index from the container footer.
+    Returns a list of (chunk_offset, plain_length) pairs.
+    """
+    src.seek(-_FOOTER.size, 2)
+    index_offset, n_chunks, magic = _FOOTER.unpack(src.read(_FOOTER.size))
+    if magic != MAGIC:
+        raise ValueError("Container footer is missing or corrupt.")
+    src.seek(index_offset)
+    raw = src.read(n_chunks * _INDEX_ENTRY.size)
+    return [_INDEX_ENTRY.unpack_from(raw, i * _INDEX_ENTRY.size) for i in range(n_chunks)]
+
+def is_container(path: str) -> bool:
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+# --------------------------------------------------
+# Streaming Encryption
+# --------------------------------------------------
+
+def encrypt_stream(src: BinaryIO, dst: BinaryIO, seeds: List[int],
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Encrypts a binary stream chunk by chunk into the container format.
+    Memory use is bounded by chunk_size. Fixed-width words are written through the
+    key's byte planes into one reused output buffer. Returns the number of chunks written.
+    """
+    if not 1 <= chunk_size <= 0xFFFFFFFF:
+        raise ValueError(f"chunk_size must be in [1, 2^32 - 1], got {chunk_size}.")
+    key = get_polynomial(seeds)
+    table = key.forward_table(BYTE_DOMAIN_SIZE)
+    width = choose_word_width(table)
+    _write_header(dst, seeds, width, chunk_size)
+    if width:
+        planes = key.byte_planes()
+        out = bytearray(chunk_size * width)
+
+    index = []
+    while True:
+        block = src.read(chunk_size)
+        if not block:
+            break
+        if width:
+            payload = memoryview(out)[:encrypt_bytes_into(block, planes, out) * width]
+        else:
+            payload = pack_words(encrypt_message_batch(block, table), width)
+        index.append((dst.tell(), len(block)))
+        dst.write(_CHUNK.pack(len(block), len(payload)))
+        dst.write(payload)
+
+    index_offset = dst.tell()
+    for entry in index:
+        dst.write(_INDEX_ENTRY.pack(*entry))
+    dst.write(_FOOTER.pack(index_offset, len(index), MAGIC))
+    return len(index)
+
+def encrypt_file(src_path: str, dst_path: str, seeds: Optional[List[int]] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[int]:
+    """
+    Encrypts src_path into a container at dst_path. Returns the seeds used.
+    """
+    if seeds is None:
+        seeds = generate_seeds(degree=3, bit_length=16, domain_size=BYTE_DOMAIN_SIZE)
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        encrypt_stream(src, dst, seeds, chunk_size)
+    return seeds
+
+# --------------------------------------------------
+# Streaming Decryption
+# --------------------------------------------------
+
+def _read_chunk(src: BinaryIO, width: int) -> Optional[List[int]]:
+    head = src.read(_CHUNK.size)
+    if len(head) < _CHUNK.size:
+        return None
+    plain_len, payload_len = _CHUNK.unpack(head)
+    return unpack_words(src.read(payload_len), width, plain_len)
+
+def iter_decrypted_chunks(src: BinaryIO) -> Iterator[bytes]:
+    """
+    Yields decrypted plaintext chunks from an open container in order.
+    """
+    seeds, width, _ = read_header(src)
+    inverse = get_polynomial(seeds).inverse_table(BYTE_DOMAIN_SIZE)
+    index = read_index(src)
+    for offset, _ in index:
+        src.seek(offset)
+        try:
+            block = decrypt_bytes(_read_chunk(src, width), inverse)
+        except ValueError as e:
+            raise ValueError(f"{e} (chunk at offset {offset})") from None
+        yield block
+
+def decrypt_stream(src: BinaryIO, dst: BinaryIO) -> int:
+    """
+    Decrypts a container stream into dst. Returns the number of plaintext bytes written.
+    """
+    written = 0
+    for block in iter_decrypted_chunks(src):
+        dst.write(block)
+        written += len(block)
+    return written
+
+def decrypt_file(src_path: str, dst_path: str) -> int:
+    """
+    Decrypts a container or a legacy JSON keyfile into dst_path.
+    Returns the number of plaintext bytes written.
+    """
+    if not is_container(src_path):
+        data = load_keyfile(src_path)
+        if "modulus" in data:
+            key = get_modular_polynomial(data["seeds"], data["modulus"])
+        else:
+            key = get_polynomial(data["seeds"])
+        plaintext = key.decrypt(data["cipher"]).encode('utf-8')
+        with open(dst_path, 'wb') as dst:
+            dst.write(plaintext)
+        return len(plaintext)
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        return decrypt_stream(src, dst)
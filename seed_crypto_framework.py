@@ -1,10 +1,9 @@
 import secrets
 from typing import List, Callable
+from seed_based_crypto import Polynomial
 
 def generate_polynomial_function(seeds: List[int]) -> Callable[[int], int]:
-    def F(x: int) -> int:
-        return sum(coef * (x ** i) for i, coef in enumerate(seeds))
-    return F
+    return Polynomial(seeds)
 
 def encrypt_message(message: str, func: Callable[[int], int]) -> List[int]:
     return [func(ord(c)) for c in message]
@@ -0,0 +1,240 @@
+"""
+Async Keyfile Service for the Seed-Based Crypto Framework
+Implements:
+- asyncio job queue serving many concurrent encrypt/decrypt requests
+- Keyfile JSON I/O offloaded to a thread pool, table building and batch encrypt/decrypt
+  to a CPU executor
+- Reuse of already-loaded keys in a bounded LRU (concurrent requests for one key share
+  a single build)
+- Queue depth, throughput and latency metrics for running under load
+"""
+
+import os
+import time
+import asyncio
+import secrets
+import statistics
+import tempfile
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Tuple
+
+from seed_based_crypto import (
+    generate_polynomial_function, get_modular_polynomial, generate_seeds, build_forward_table, build_inverse_table,
+    encrypt_message_batch, decrypt_message_batch, save_keyfile, load_keyfile
+)
+
+# --------------------------------------------------
+# Constants
+# --------------------------------------------------
+
+DEFAULT_WORKERS = 32  # Concurrent jobs taken off the queue
+LATENCY_WINDOW = 10_000  # Latency samples kept per operation
+KEY_CACHE_SIZE = 128  # Key tables kept loaded, least recently used evicted first
+
+KeyTables = Tuple[List[int], Dict[int, int]]
+KeyId = Tuple[Tuple[int, ...], Optional[int]]  # (seeds, modulus or None)
+
+def _build_key_tables(key: KeyId) -> KeyTables:
+    """
+    Forward and inverse ASCII tables for a (seeds, modulus) key; modular keys reduce
+    every word mod modulus. Module-level so it can run in a process pool as well as
+    a thread pool.
+    """
+    seeds, modulus = key
+    if modulus is None:
+        func = generate_polynomial_function(list(seeds))
+    else:
+        func = get_modular_polynomial(seeds, modulus)
+    table = build_forward_table(func)
+    return table, build_inverse_table(table)
+
+# --------------------------------------------------
+# Service
+# --------------------------------------------------
+
+class CryptoService:
+    """
+    Async encrypt/decrypt service. Use as `async with CryptoService() as svc:`.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, io_executor: Optional[Executor] = None,
+                 cpu_executor: Optional[Executor] = None, max_queue: int = 0,
+                 max_keys: int = KEY_CACHE_SIZE):
+        self.workers = workers
+        self.max_keys = max_keys
+        self._io = io_executor or ThreadPoolExecutor(max_workers=8, thread_name_prefix='crypto-io')
+        self._cpu = cpu_executor or ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                       thread_name_prefix='crypto-cpu')
+        self._owns_executors = (io_executor is None, cpu_executor is None)
+        self._max_queue = max_queue
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._keys: 'OrderedDict[KeyId, KeyTables]' = OrderedDict()
+        self._building: Dict[KeyId, asyncio.Future] = {}
+        self._latency: Dict[str, Deque[float]] = {'encrypt': deque(maxlen=LATENCY_WINDOW),
+                                                  'decrypt': deque(maxlen=LATENCY_WINDOW)}
+        self._counts = {'completed': 0, 'failed': 0, 'running': 0, 'key_hits': 0, 'key_misses': 0}
+        self._started = 0.0
+
+    async def __aenter__(self) -> 'CryptoService':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue(self._max_queue)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._started = time.perf_counter()
+
+    async def stop(self) -> None:
+        if self._queue is None:
+            raise RuntimeError("CryptoService is not running; call start() first.")
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._owns_executors[0]:
+            self._io.shutdown()
+        if self._owns_executors[1]:
+            self._cpu.shutdown()
+        self._queue = None
+
+    # --------------------------------------------------
+    # Public API
+    # --------------------------------------------------
+
+    async def encrypt(self, plaintext: str, keyfile: str, seeds: Optional[List[int]] = None) -> List[int]:
+        """
+        Encrypts plaintext and stores seeds and ciphertext in keyfile. Returns the ciphertext.
+        """
+        return await self._submit('encrypt', plaintext, keyfile, seeds)
+
+    async def decrypt(self, keyfile: str) -> str:
+        """
+        Loads keyfile and returns the decrypted plaintext.
+        """
+        return await self._submit('decrypt', keyfile)
+
+    def metrics(self) -> Dict[str, object]:
+        elapsed = time.perf_counter() - self._started if self._started else 0.0
+        report = {
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'running': self._counts['running'],
+            'completed': self._counts['completed'],
+            'failed': self._counts['failed'],
+            'jobs_per_s': self._counts['completed'] / elapsed if elapsed > 0 else 0.0,
+            'keys_loaded': len(self._keys),
+            'key_hits': self._counts['key_hits'],
+            'key_misses': self._counts['key_misses'],
+        }
+        for op, samples in self._latency.items():
+            ordered = sorted(samples)
+            report[f'{op}_p50_ms'] = statistics.median(ordered) * 1e3 if ordered else 0.0
+            report[f'{op}_p99_ms'] = ordered[round(0.99 * (len(ordered) - 1))] * 1e3 if ordered else 0.0
+        return report
+
+    # --------------------------------------------------
+    # Internals
+    # --------------------------------------------------
+
+    async def _submit(self, op: str, *args) -> object:
+        if self._queue is None:
+            raise RuntimeError("CryptoService is not running; call start() first.")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, args, future, time.perf_counter()))
+        return await future
+
+    async def _worker(self) -> None:
+        while True:
+            op, args, future, enqueued = await self._queue.get()
+            self._counts['running'] += 1
+            try:
+                handler = self._encrypt if op == 'encrypt' else self._decrypt
+                result = await handler(*args)
+            except Exception as e:
+                self._counts['failed'] += 1
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                self._counts['completed'] += 1
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._latency[op].append(time.perf_counter() - enqueued)
+                self._counts['running'] -= 1
+                self._queue.task_done()
+
+    async def _tables(self, seeds: List[int], modulus: Optional[int] = None) -> KeyTables:
+        key = (tuple(seeds), modulus)
+        tables = self._keys.get(key)
+        if tables is not None:
+            self._keys.move_to_end(key)
+            self._counts['key_hits'] += 1
+            return tables
+        pending = self._building.get(key)
+        if pending is not None:
+            self._counts['key_hits'] += 1
+            return await pending
+        self._counts['key_misses'] += 1
+        pending = asyncio.get_running_loop().run_in_executor(self._cpu, _build_key_tables, key)
+        self._building[key] = pending
+        try:
+            tables = await pending
+        finally:
+            del self._building[key]
+        self._keys[key] = tables
+        while len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+        return tables
+
+    async def _encrypt(self, plaintext: str, keyfile: str, seeds: Optional[List[int]]) -> List[int]:
+        if seeds is None:
+            seeds = generate_seeds(degree=3, bit_length=16)
+        table, _ = await self._tables(seeds)
+        loop = asyncio.get_running_loop()
+        cipher = await loop.run_in_executor(self._cpu, encrypt_message_batch, plaintext, table)
+        await loop.run_in_executor(self._io, save_keyfile, seeds, cipher, keyfile)
+        return cipher
+
+    async def _decrypt(self, keyfile: str) -> str:
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(self._io, load_keyfile, keyfile)
+        _, inverse = await self._tables(data["seeds"], data.get("modulus"))
+        return await loop.run_in_executor(self._cpu, decrypt_message_batch, data["cipher"], inverse)
+
+# --------------------------------------------------
+# Local Stand-In Client
+# --------------------------------------------------
+
+async def run_local_client(jobs: int = 1000, message_size: int = 256, distinct_keys: int = 16,
+                           directory: Optional[str] = None) -> Dict[str, object]:
+    """
+    Drives a CryptoService the way a remote client would: `jobs` concurrent
+    encrypt requests over `distinct_keys` seed sets, then `jobs` concurrent decrypts
+    of the resulting keyfiles. Verifies every round trip and returns the metrics.
+    """
+    directory = directory or tempfile.mkdtemp(prefix='crypto-service-')
+    key_pool = [generate_seeds(degree=3, bit_length=16) for _ in range(distinct_keys)]
+    messages = [''.join(chr(32 + secrets.randbelow(95)) for _ in range(message_size)) for _ in range(jobs)]
+    paths = [os.path.join(directory, f'job_{i}.json') for i in range(jobs)]
+
+    async with CryptoService() as service:
+        await asyncio.gather(*(service.encrypt(msg, path, key_pool[i % distinct_keys])
+                               for i, (msg, path) in enumerate(zip(messages, paths))))
+        plaintexts = await asyncio.gather(*(service.decrypt(path) for path in paths))
+        report = service.metrics()
+    report['round_trip_ok'] = plaintexts == messages
+    return report
+
+# --------------------------------------------------
+# Entry Point
+# --------------------------------------------------
+
+if __name__ == "__main__":
+    metrics = asyncio.run(run_local_client())
+    print("=== CRYPTO SERVICE (LOCAL CLIENT) ===")
+    for name, value in metrics.items():
+        print(f"{name}: {value:.2f}" if isinstance(value, float) else f"{name}: {value}")
@@ -0,0 +1,229 @@
+"""
+Multi-Key Keystore for the Seed-Based Crypto Framework
+Implements:
+- One SQLite file holding many seed sets by key ID (primary-key index lookups)
+- Ciphertexts kept in a separate table as packed binary words, not JSON lists
+- Batch loading of many keys in a single query
+- Lazy keys: loading returns cached Polynomial objects whose forward/inverse tables
+  are only built on first encrypt/decrypt
+- Import of legacy JSON keyfiles
+"""
+
+import sqlite3
+import secrets
+from typing import Dict, Iterable, List, Optional, Union
+
+from seed_based_crypto import (
+    Polynomial, get_polynomial, get_modular_polynomial, generate_seeds, load_keyfile
+)
+from seed_container import choose_word_width, pack_words, unpack_words
+
+# --------------------------------------------------
+# Constants
+# --------------------------------------------------
+
+SCHEMA_VERSION = 1
+BATCH_PARAMS = 500  # Key IDs per IN (...) query, below SQLite's parameter limit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS keys (
+    key_id  TEXT PRIMARY KEY,
+    seeds   BLOB NOT NULL,      -- zigzag varints
+    n_seeds INTEGER NOT NULL,
+    modulus INTEGER             -- NULL for plain integer keys
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ciphers (
+    key_id  TEXT NOT NULL REFERENCES keys(key_id) ON DELETE CASCADE,
+    name    TEXT NOT NULL,
+    width   INTEGER NOT NULL,   -- bytes per word, 0 = varint
+    signed  INTEGER NOT NULL,   -- 1 when words are zigzag encoded
+    length  INTEGER NOT NULL,
+    words   BLOB NOT NULL,
+    PRIMARY KEY (key_id, name)
+) WITHOUT ROWID;
+"""
+
+# --------------------------------------------------
+# Word Encoding
+# --------------------------------------------------
+
+def _zigzag(values: Iterable[int]) -> List[int]:
+    return [2 * v if v >= 0 else -2 * v - 1 for v in values]
+
+def _unzigzag(values: Iterable[int]) -> List[int]:
+    return [v >> 1 if v % 2 == 0 else -(v + 1 >> 1) for v in values]
+
+def _pack_seeds(seeds: List[int]) -> bytes:
+    return pack_words(_zigzag(seeds), 0)
+
+def _unpack_seeds(blob: bytes, count: int) -> List[int]:
+    return _unzigzag(unpack_words(blob, 0, count))
+
+# --------------------------------------------------
+# Keystore
+# --------------------------------------------------
+
+class KeyStore:
+    """
+    Seed sets and ciphertexts in one SQLite file. Use as `with KeyStore(path) as ks:`.
+    """
+
+    def __init__(self, path: str = "keystore.db"):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(_SCHEMA)
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'schema_version'").fetchone()
+        if row is None:
+            self._db.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+            self._db.commit()
+        elif int(row[0]) != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported keystore schema version: {row[0]}")
+
+    def __enter__(self) -> 'KeyStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM keys").fetchone()[0]
+
+    def __contains__(self, key_id: str) -> bool:
+        return self._db.execute("SELECT 1 FROM keys WHERE key_id = ?", (key_id,)).fetchone() is not None
+
+    # --------------------------------------------------
+    # Keys
+    # --------------------------------------------------
+
+    def add_key(self, seeds: List[int], key_id: Optional[str] = None, modulus: Optional[int] = None) -> str:
+        """
+        Stores a seed set and returns its key ID (a random hex ID when none is given).
+        """
+        key_id = key_id or secrets.token_hex(8)
+        with self._db:
+            self._db.execute("INSERT INTO keys VALUES (?, ?, ?, ?)",
+                             (key_id, _pack_seeds(seeds), len(seeds), modulus))
+        return key_id
+
+    def add_keys(self, seed_sets: Iterable[List[int]], modulus: Optional[int] = None) -> List[str]:
+        """
+        Stores many seed sets in one transaction. Returns their new key IDs in order.
+        """
+        rows = [(secrets.token_hex(8), _pack_seeds(seeds), len(seeds), modulus) for seeds in seed_sets]
+        with self._db:
+            self._db.executemany("INSERT INTO keys VALUES (?, ?, ?, ?)", rows)
+        return [row[0] for row in rows]
+
+    def delete_key(self, key_id: str) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM keys WHERE key_id = ?", (key_id,))
+
+    def key_ids(self) -> List[str]:
+        return [row[0] for row in self._db.execute("SELECT key_id FROM keys ORDER BY key_id")]
+
+    def get_seeds(self, key_id: str) -> List[int]:
+        row = self._db.execute("SELECT seeds, n_seeds FROM keys WHERE key_id = ?", (key_id,)).fetchone()
+        if row is None:
+            raise KeyError(key_id)
+        return _unpack_seeds(*row)
+
+    def get_key(self, key_id: str) -> Polynomial:
+        """
+        The key as a cached (Modular)Polynomial; its tables are built on first use.
+        """
+        row = self._db.execute("SELECT seeds, n_seeds, modulus FROM keys WHERE key_id = ?", (key_id,)).fetchone()
+        if row is None:
+            raise KeyError(key_id)
+        return self._materialize(*row)
+
+    def load_keys(self, key_ids: Iterable[str]) -> Dict[str, Polynomial]:
+        """
+        Batch lookup: one query per BATCH_PARAMS IDs. Missing IDs raise KeyError.
+        """
+        key_ids = list(key_ids)
+        keys = {}
+        for i in range(0, len(key_ids), BATCH_PARAMS):
+            batch = key_ids[i:i + BATCH_PARAMS]
+            marks = ', '.join('?' * len(batch))
+            query = f"SELECT key_id, seeds, n_seeds, modulus FROM keys WHERE key_id IN ({marks})"
+            for key_id, blob, n_seeds, modulus in self._db.execute(query, batch):
+                keys[key_id] = self._materialize(blob, n_seeds, modulus)
+        missing = [k for k in key_ids if k not in keys]
+        if missing:
+            raise KeyError(f"Unknown key IDs: {missing[:10]}")
+        return keys
+
+    @staticmethod
+    def _materialize(blob: bytes, n_seeds: int, modulus: Optional[int]) -> Polynomial:
+        seeds = _unpack_seeds(blob, n_seeds)
+        return get_modular_polynomial(seeds, modulus) if modulus else get_polynomial(seeds)
+
+    # --------------------------------------------------
+    # Ciphertexts
+    # --------------------------------------------------
+
+    def put_cipher(self, key_id: str, cipher: Iterable[int], name: str = "default") -> None:
+        """
+        Stores (or replaces) a ciphertext under (key_id, name) as packed words.
+        """
+        words = list(cipher)
+        signed = bool(words) and min(words) < 0
+        if signed:
+            words, width = _zigzag(words), 0
+        else:
+            width = choose_word_width(words)
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO ciphers VALUES (?, ?, ?, ?, ?, ?)",
+                             (key_id, name, width, int(signed), len(words), pack_words(words, width)))
+
+    def get_cipher(self, key_id: str, name: str = "default") -> List[int]:
+        row = self._db.execute("SELECT width, signed, length, words FROM ciphers WHERE key_id = ? AND name = ?",
+                               (key_id, name)).fetchone()
+        if row is None:
+            raise KeyError((key_id, name))
+        width, signed, length, blob = row
+        words = unpack_words(blob, width, length)
+        return _unzigzag(words) if signed else words
+
+    def cipher_names(self, key_id: str) -> List[str]:
+        return [row[0] for row in self._db.execute(
+            "SELECT name FROM ciphers WHERE key_id = ? ORDER BY name", (key_id,))]
+
+    # --------------------------------------------------
+    # Workflow
+    # --------------------------------------------------
+
+    def encrypt(self, key_id: str, message: Union[str, bytes], name: str = "default") -> List[int]:
+        cipher = list(self.get_key(key_id).encrypt(message))
+        self.put_cipher(key_id, cipher, name)
+        return cipher
+
+    def decrypt(self, key_id: str, name: str = "default") -> str:
+        return self.get_key(key_id).decrypt(self.get_cipher(key_id, name))
+
+    def import_keyfile(self, filename: str, key_id: Optional[str] = None, name: str = "default") -> str:
+        """
+        Copies a legacy JSON keyfile (seeds, cipher, optional modulus) into the store.
+        """
+        data = load_keyfile(filename)
+        key_id = self.add_key(data["seeds"], key_id, data.get("modulus"))
+        self.put_cipher(key_id, data["cipher"], name)
+        return key_id
+
+# --------------------------------------------------
+# Example
+# --------------------------------------------------
+
+if __name__ == "__main__":
+    with KeyStore(":memory:") as store:
+        ids = store.add_keys(generate_seeds() for _ in range(1000))
+        for key_id in ids[:10]:
+            store.encrypt(key_id, f"message for {key_id}")
+        keys = store.load_keys(ids)
+        print(f"Keys stored: {len(store)}, loaded in one batch: {len(keys)}")
+        print(f"Decrypted: {store.decrypt(ids[0])}")
@@ -4,10 +4,18 @@ Simulates brute-force and known-plaintext attacks against:
 "A Custom Function-Based Seed-Driven Framework for Cryptographic Encryption"
 """
 
+import os
 import time
+import random
 import secrets
-from typing import Callable, List
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from fractions import Fraction
+from itertools import repeat
+from math import lcm
+from operator import add, mul
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from seed_crypto_framework import generate_polynomial_function, encrypt_message, generate_seeds
+from seed_based_crypto import Polynomial
 
 # --------------------------------------------------
 # Constants
@@ -16,6 +24,8 @@ from seed_crypto_framework import generate_polynomial_function, encrypt_message,
 ASCII_RANGE = range(128)
 SEED_BIT_LENGTH = 16  # Match encryption strength
 MAX_GUESSES = 100_000  # Max simulated brute-force attempts
+KERNEL_BATCH = 4096  # Candidate seed vectors evaluated per kernel step
+TASK_GUESSES = 250_000  # Guesses per scheduled worker task
 
 # --------------------------------------------------
 # Attack Simulations
@@ -46,7 +56,8 @@ def collision_test(func: Callable[[int], int], domain: range = ASCII_RANGE) -> f
     unique_outputs = set(outputs)
     return 100.0 * len(unique_outputs) / len(outputs)
 
-def known_plaintext_attack(cipher: List[int], known_char: str, degree: int = 3) -> float:
+def known_plaintext_attack(cipher: List[int], known_char: str, degree: int = 3,
+                           bit_length: int = SEED_BIT_LENGTH) -> float:
     """
     Try to match a single known character's ciphertext to its value in cipher.
     Returns likelihood of randomly guessing the correct polynomial by single char.
@@ -56,12 +67,255 @@ def known_plaintext_attack(cipher: List[int], known_char: str, degree: int = 3)
 
     matches = 0
     for _ in range(MAX_GUESSES):
-        seeds = generate_seeds(degree, SEED_BIT_LENGTH)
+        seeds = generate_seeds(degree, bit_length)
         f = generate_polynomial_function(seeds)
         if f(x) == y_target:
             matches += 1
     return 100.0 * matches / MAX_GUESSES
 
+# --------------------------------------------------
+# Parallel Attack Engine
+# --------------------------------------------------
+
+def _evaluate_batch(columns: List[List[int]], powers: Sequence[int], n: int) -> List[int]:
+    """
+    Evaluates n candidate polynomials at one x. columns[i] holds coefficient i of
+    every candidate and powers[i] == x**i, so each step is a C-level map over the batch.
+    """
+    acc = columns[0]
+    for col, pw in zip(columns[1:], powers[1:]):
+        acc = list(map(add, acc, map(mul, col, repeat(pw, n))))
+    return acc
+
+def _guess_task(task: Tuple[int, int, int, int, Tuple[int, ...], Tuple[int, ...], bool]) -> Tuple[int, int, Optional[List[int]], Optional[int]]:
+    """
+    Worker task: tests `count` random seed vectors drawn from a RNG seeded by
+    (run_seed, task_index) so results do not depend on the number of workers.
+    Returns (tested, matches, first_hit_seeds, first_hit_attempt), where the attempt
+    is 1-based within the task.
+    """
+    run_seed, task_index, count, degree, xs, targets, stop_on_first = task
+    rng = random.Random((run_seed << 32) | task_index)
+    population = range((1 << SEED_BIT_LENGTH) - 1)
+    all_powers = [[x ** i for i in range(degree + 1)] for x in xs]
+
+    tested = matches = 0
+    first_hit = first_attempt = None
+    while tested < count:
+        n = min(KERNEL_BATCH, count - tested)
+        columns = [rng.choices(population, k=n) for _ in range(degree + 1)]
+        head = _evaluate_batch(columns, all_powers[0], n)
+        tested += n
+        if targets[0] not in head:
+            continue
+        for j, v in enumerate(head):
+            if v != targets[0]:
+                continue
+            cand = [col[j] for col in columns]
+            if all(_evaluate_batch([[c] for c in cand], pw, 1)[0] == t
+                   for pw, t in zip(all_powers[1:], targets[1:])):
+                matches += 1
+                if first_hit is None:
+                    first_hit, first_attempt = cand, tested - n + j + 1
+                if stop_on_first:
+                    return tested, matches, first_hit, first_attempt
+    return tested, matches, first_hit, first_attempt
+
+def parallel_seed_search(xs: Sequence[int], targets: Sequence[int], total_guesses: int,
+                         degree: int = 3, workers: Optional[int] = None,
+                         run_seed: Optional[int] = None, stop_on_first: bool = True,
+                         progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, object]:
+    """
+    Shards the random seed-guess space across a process pool.
+    A guess matches when F(xs[k]) == targets[k] for every k. With stop_on_first the
+    search ends on the first hit; otherwise all matches are counted.
+    'first_attempt' is the 1-based index of that hit in the guess sequence, as in the
+    serial attacks. The run is reproducible from run_seed, which is reported in the result.
+    """
+    if run_seed is None:
+        run_seed = secrets.randbits(32)
+    workers = workers or os.cpu_count() or 1
+    n_tasks = -(-total_guesses // TASK_GUESSES)
+
+    def make_task(i: int):
+        count = min(TASK_GUESSES, total_guesses - i * TASK_GUESSES)
+        return (run_seed, i, count, degree, tuple(xs), tuple(targets), stop_on_first)
+
+    tested = matches = 0
+    first_hit = first_attempt = None
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        next_task = 0
+        pending = {}
+        while next_task < n_tasks or pending:
+            # After a hit only earlier tasks can still hold a lower attempt index
+            limit = n_tasks if first_attempt is None else (first_attempt - 1) // TASK_GUESSES
+            while next_task < limit and len(pending) < 2 * workers:
+                pending[pool.submit(_guess_task, make_task(next_task))] = next_task
+                next_task += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                t, m, hit, attempt = fut.result()
+                tested += t
+                matches += m
+                if hit is not None:
+                    attempt += pending[fut] * TASK_GUESSES
+                    if first_attempt is None or attempt < first_attempt:
+                        first_hit, first_attempt = hit, attempt
+                del pending[fut]
+            if progress is not None:
+                progress(tested, total_guesses)
+            if stop_on_first and first_hit is not None:
+                hit_task = (first_attempt - 1) // TASK_GUESSES
+                for fut in [f for f, i in pending.items() if i > hit_task]:
+                    fut.cancel()
+                    del pending[fut]
+                if not pending and next_task >= hit_task:
+                    break
+    elapsed = time.perf_counter() - start
+    return {
+        'tested': tested,
+        'matches': matches,
+        'first_hit': first_hit,
+        'first_attempt': first_attempt,
+        'elapsed': elapsed,
+        'guesses_per_s': tested / elapsed if elapsed > 0 else 0.0,
+        'run_seed': run_seed,
+        'workers': workers,
+    }
+
+def parallel_brute_force_seed_guess(cipher: List[int], target_plain: str, degree: int = 3,
+                                    guesses: int = MAX_GUESSES, **kwargs) -> float:
+    """
+    Multi-core counterpart of brute_force_seed_guess with the same return semantics.
+    """
+    result = parallel_seed_search([ord(c) for c in target_plain], cipher, guesses,
+                                  degree, stop_on_first=True, **kwargs)
+    if result['first_hit'] is None:
+        return 0.0
+    return 100.0 * (1 / result['first_attempt'])
+
+def parallel_known_plaintext_attack(cipher: List[int], known_char: str, degree: int = 3,
+                                    guesses: int = MAX_GUESSES, **kwargs) -> float:
+    """
+    Multi-core counterpart of known_plaintext_attack with the same return semantics.
+    """
+    result = parallel_seed_search([ord(known_char)], cipher[:1], guesses,
+                                  degree, stop_on_first=False, **kwargs)
+    return 100.0 * result['matches'] / result['tested']
+
+# --------------------------------------------------
+# Algebraic Key Recovery
+# --------------------------------------------------
+
+def _vandermonde_inverse(xs: Sequence[int]) -> Tuple[List[List[int]], int]:
+    """
+    Exact inverse of the Vandermonde matrix V[j][i] = xs[j]**i as (A, D) with
+    integer A such that V^-1 == A / D. Gauss-Jordan over the rationals.
+    """
+    n = len(xs)
+    aug = [[Fraction(x ** i) for i in range(n)] + [Fraction(int(r == c)) for c in range(n)]
+           for r, x in enumerate(xs)]
+    for col in range(n):
+        pivot = next(r for r in range(col, n) if aug[r][col] != 0)
+        aug[col], aug[pivot] = aug[pivot], aug[col]
+        inv = 1 / aug[col][col]
+        aug[col] = [v * inv for v in aug[col]]
+        for r in range(n):
+            if r != col and aug[r][col] != 0:
+                factor = aug[r][col]
+                aug[r] = [a - factor * b for a, b in zip(aug[r], aug[col])]
+    inverse = [row[n:] for row in aug]
+    D = lcm(*(v.denominator for row in inverse for v in row))
+    return [[int(v * D) for v in row] for row in inverse], D
+
+def recover_seeds(pairs: Sequence[Tuple[int, int]], degree: int = 3,
+                  bit_length: int = SEED_BIT_LENGTH, limit: int = 1000,
+                  max_nodes: int = 10_000_000) -> Dict[str, object]:
+    """
+    Recovers every seed vector (each seed in [0, 2^bit_length - 2], as drawn by
+    generate_seeds) consistent with the known (x, F(x)) pairs.
+
+    With degree+1 distinct pairs the Vandermonde system is solved exactly. With fewer
+    pairs the top free coefficients are enumerated from the highest degree down, each
+    restricted to the interval left open by every pair's remaining residual, and the
+    low coefficients are solved exactly at the leaves.
+    Returns solutions (at most `limit`), nodes visited, whether the search was exhausted
+    and the wall time.
+    """
+    start = time.perf_counter()
+    known: Dict[int, int] = {}
+    for x, y in pairs:
+        if known.setdefault(x, y) != y:
+            return {'solutions': [], 'nodes': 0, 'exhausted': True, 'elapsed': time.perf_counter() - start}
+    xs = list(known)
+    ys = [known[x] for x in xs]
+    k = min(len(xs), degree + 1)
+    M = (1 << bit_length) - 2
+    A, D = _vandermonde_inverse(xs[:k])
+    # Maximum contribution of all coefficients below degree i, per pair
+    lower_max = [[M * sum(x ** j for j in range(i)) for i in range(degree + 1)] for x in xs]
+
+    solutions: List[List[int]] = []
+    nodes = 0
+    free = [0] * (degree + 1 - k)
+
+    def leaf(residuals: List[int]) -> None:
+        low = []
+        for row in A:
+            num = sum(a * r for a, r in zip(row, residuals))
+            if num % D:
+                return
+            s = num // D
+            if not 0 <= s <= M:
+                return
+            low.append(s)
+        cand = low + free[::-1]
+        f = Polynomial(cand)
+        if all(f(x) == y for x, y in zip(xs[k:], ys[k:])):
+            solutions.append(cand)
+
+    def descend(i: int, residuals: List[int]) -> bool:
+        nonlocal nodes
+        nodes += 1
+        if nodes > max_nodes or len(solutions) >= limit:
+            return False
+        if i < k:
+            leaf(residuals[:k])
+            return True
+        lo, hi = 0, M
+        for x, r, bounds in zip(xs, residuals, lower_max):
+            if x == 0:
+                continue
+            xi = x ** i
+            lo = max(lo, -(-(r - bounds[i]) // xi))
+            hi = min(hi, r // xi)
+            if lo > hi:
+                return True
+        powers = [x ** i for x in xs]
+        for s in range(lo, hi + 1):
+            free[degree - i] = s
+            if not descend(i - 1, [r - s * p for r, p in zip(residuals, powers)]):
+                return False
+        return True
+
+    exhausted = descend(degree, ys)
+    return {
+        'solutions': solutions,
+        'nodes': nodes,
+        'exhausted': exhausted,
+        'elapsed': time.perf_counter() - start,
+    }
+
+def algebraic_known_plaintext_attack(cipher: List[int], known_plain: str, degree: int = 3,
+                                     bit_length: int = SEED_BIT_LENGTH, **kwargs) -> Dict[str, object]:
+    """
+    Solver-based replacement for known_plaintext_attack: recovers the seeds from
+    aligned (plaintext, ciphertext) prefixes instead of sampling random guesses.
+    """
+    pairs = [(ord(c), y) for c, y in zip(known_plain, cipher)]
+    return recover_seeds(pairs, degree, bit_length, **kwargs)
+
 # --------------------------------------------------
 # Test Runner
 # --------------------------------------------------
@@ -89,12 +343,22 @@ def run_crypto_strength_tests():
     collision_percent = collision_test(f)
     known_plain_percent = known_plaintext_attack(cipher, message[0], degree)
 
+    algebraic = algebraic_known_plaintext_attack(cipher, message, degree)
+
+    parallel = parallel_seed_search([ord(c) for c in message], cipher, MAX_GUESSES * 10, degree)
+
     # Report
     print("🧪 Results:")
     print(f"Brute-force attack success rate: {brute_percent:.6f}%")
     print(f"Brute-force test time: {brute_time:.2f} seconds")
     print(f"Function injectivity (collision resistance): {collision_percent:.2f}%")
     print(f"Known-plaintext attack match rate: {known_plain_percent:.6f}%")
+    print(f"Algebraic recovery: {len(algebraic['solutions'])} consistent seed set(s) "
+          f"({'exhaustive' if algebraic['exhausted'] else 'search capped'}) "
+          f"in {algebraic['elapsed']:.2f} seconds")
+    print(f"Parallel brute-force: {parallel['tested']} guesses on {parallel['workers']} workers "
+          f"in {parallel['elapsed']:.2f} seconds ({parallel['guesses_per_s']:,.0f} guesses/s, "
+          f"run seed {parallel['run_seed']})")
 
 # --------------------------------------------------
 # Entry Point
@@ -0,0 +1,259 @@
+"""
+Persistent Sequence Cache for the Division-Free Generators
+Stores generated sequences on disk, keyed by method name and canonicalized
+parameters, so identical requests survive restarts:
+- Compact length-prefixed binary entries, read through mmap
+- Prefix reuse: a cached run of n values serves any count <= n, and larger
+  requests extend it from the loop position stored with it
+- Size-based eviction (least recently used entries first) and hit/miss statistics
+
+Entry layout (little-endian):
+    magic 'SQC3' | value count u64 | complete flag u8 | state length u32 | state (JSON) | values
+The state is the provider's loop position after the last value. Each value is a varint byte length followed by that many bytes of the zigzag-encoded
+value, so entries hold unbounded ints without padding them to the widest one.
+"""
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+from itertools import islice
+from math import lcm
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from method_1 import iter_method1_values
+from method_2 import MAX_POWER, iter_lcm_power_offset
+from method_2_1 import iter_enhanced_lcm_values
+
+# --------------------------------------------------
+# Constants
+# --------------------------------------------------
+
+MAGIC = b'SQC3'
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'divisor_free')
+DEFAULT_MAX_BYTES = 256 << 20  # 256 MiB
+
+_HEADER = struct.Struct('<4sQBI')
+
+# --------------------------------------------------
+# Value Providers
+# --------------------------------------------------
+
+# A provider receives the canonical parameters and the loop position stored after the
+# cached values (None for an empty entry), and yields (value, position after it) for
+# the values that follow. Positions must be JSON-serializable.
+Provider = Callable[[Dict[str, object], Optional[object]], Iterator[Tuple[int, object]]]
+
+def _method1_provider(params: Dict[str, object], state: Optional[int]) -> Iterator[Tuple[int, int]]:
+    divisors = params['divisors']
+    L = lcm(*divisors)
+    # Every value is i*L + c with c < L; the position is the next multiplier
+    for value in iter_method1_values(divisors, start_multiplier=state or 1):
+        yield value, value // L + 1
+
+def _method2_provider(params: Dict[str, object], state: Optional[List[object]]) -> Iterator[Tuple[int, List[object]]]:
+    # max_power None means no exponent cap; capped entries become complete like method_lcm_power_offset
+    start = (1, '+') if state is None else tuple(state)
+    for p, op, value in iter_lcm_power_offset(params['divisors'], params['base'], params['max_power'], start):
+        yield value, [p, '-'] if op == '+' else [p + 1, '+']
+
+def _method2_1_provider(params: Dict[str, object], state: Optional[List[int]]) -> Iterator[Tuple[int, List[int]]]:
+    values = iter_enhanced_lcm_values(params['main_divisors'], params['extra_primes'], params['max_power'],
+                                      params['max_prime_power'], (1, 0, 1, 0) if state is None else tuple(state))
+    for value, position in values:
+        yield value, list(position)
+
+def _sorted_unique(values) -> List[int]:
+    return sorted(set(values))
+
+def _optional_int(value) -> Optional[int]:
+    return None if value is None else int(value)
+
+# method name -> (provider, canonicalizers for each parameter, defaults of optional parameters)
+PROVIDERS: Dict[str, Tuple[Provider, Dict[str, Callable[[object], object]], Dict[str, object]]] = {
+    'method1_lcm_offset_odd_only': (_method1_provider, {'divisors': _sorted_unique}, {}),
+    'method_lcm_power_offset': (_method2_provider,
+                                {'divisors': _sorted_unique, 'base': int, 'max_power': _optional_int},
+                                {'max_power': MAX_POWER}),
+    'enhanced_lcm_method': (_method2_1_provider, {
+        'main_divisors': _sorted_unique,
+        'extra_primes': list,  # order decides output order
+        'max_power': int,
+        'max_prime_power': int,
+    }, {}),
+}
+
+def canonical_params(method: str, params: Dict[str, object]) -> Dict[str, object]:
+    """
+    Validates a method's parameters, fills in defaults and canonicalizes them.
+    """
+    if method not in PROVIDERS:
+        raise ValueError(f"Unknown method: {method}")
+    _, canon, defaults = PROVIDERS[method]
+    params = {**defaults, **params}
+    if set(params) != set(canon):
+        raise ValueError(f"{method} expects parameters {sorted(canon)}")
+    return {k: canon[k](v) for k, v in params.items()}
+
+# --------------------------------------------------
+# Entry Encoding
+# --------------------------------------------------
+
+def _encode_values(values: List[int]) -> bytes:
+    out = bytearray()
+    for v in values:
+        z = 2 * v if v >= 0 else -2 * v - 1  # zigzag
+        n = (z.bit_length() + 7) // 8
+        while n > 0x7F:
+            out.append((n & 0x7F) | 0x80)
+            n >>= 7
+        out.append(n)
+        out += z.to_bytes((z.bit_length() + 7) // 8, 'little')
+    return bytes(out)
+
+def _decode_values(data, count: int, pos: int = 0) -> List[int]:
+    values = []
+    for _ in range(count):
+        n = shift = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            n |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        z = int.from_bytes(data[pos:pos + n], 'little')
+        pos += n
+        values.append(z >> 1 if z % 2 == 0 else -(z + 1 >> 1))
+    return values
+
+def _write_entry(path: str, count: int, complete: bool, state: object, encoded: bytes) -> None:
+    """
+    Writes an entry of `count` values, already encoded, through a temporary file.
+    """
+    tmp = path + '.tmp'
+    blob = json.dumps(state).encode()
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, count, int(complete), len(blob)))
+            f.write(blob)
+            f.write(encoded)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def _read_entry(path: str, limit: int) -> Optional[Tuple[List[int], int, bool, object, bytes]]:
+    """
+    Maps an entry and decodes at most `limit` values. Returns (values, stored_count,
+    complete, state, encoded), where encoded holds the raw values when all of them were
+    decoded (b'' otherwise), or None for an entry in an older format.
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:3] == MAGIC[:3] and mm[:4] != MAGIC:
+            return None
+        if len(mm) < _HEADER.size or mm[:4] != MAGIC:
+            raise ValueError(f"Corrupt sequence cache entry: {path}")
+        _, n, complete, state_len = _HEADER.unpack_from(mm, 0)
+        base = _HEADER.size + state_len
+        try:
+            state = json.loads(mm[_HEADER.size:base])
+            values = _decode_values(mm, min(n, limit), base)
+        except (IndexError, ValueError):
+            raise ValueError(f"Corrupt sequence cache entry: {path}") from None
+        encoded = mm[base:] if limit >= n else b''
+    return values, n, bool(complete), state, encoded
+
+# --------------------------------------------------
+# Cache
+# --------------------------------------------------
+
+class SequenceCache:
+    """
+    Content-addressed on-disk cache of generated sequences.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.extensions = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, method: str, **params) -> str:
+        payload = json.dumps({'method': method, 'params': canonical_params(method, params)}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.sqc')
+
+    def get(self, method: str, count: int, **params) -> List[int]:
+        """
+        Returns the first `count` values of the sequence (fewer if the method's search
+        space is exhausted), serving from and extending the on-disk entry.
+        """
+        key = self.key(method, **params)
+        path = self._path(key)
+        canon = canonical_params(method, params)
+
+        entry = _read_entry(path, count) if os.path.exists(path) else None
+        cached, stored, complete, state, encoded = entry or ([], 0, False, None, b'')
+        if entry is not None:
+            if count <= stored or complete:
+                self.hits += 1
+                os.utime(path)
+                return cached
+            self.extensions += 1
+        else:
+            self.misses += 1
+
+        more = []
+        for value, state in islice(PROVIDERS[method][0](canon, state), count - len(cached)):
+            more.append(value)
+        values = cached + more
+        # Stored values are copied as they are; only the new ones are encoded
+        _write_entry(path, len(values), len(values) < count, state, encoded + _encode_values(more))
+        self._evict(keep=path)
+        return values
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.sqc'):
+                path = os.path.join(self.directory, name)
+                st = os.stat(path)
+                entries.append((st.st_mtime, st.st_size, path))
+        return sorted(entries)
+
+    def _evict(self, keep: str) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            os.remove(path)
+            total -= size
+            self.evictions += 1
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'extensions': self.extensions,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries()),
+            'bytes': self.size_bytes(),
+        }
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            os.remove(path)
@@ -0,0 +1,226 @@
+"""
+Reference Generators
+The generator functions as first published (trial division, no caching), kept
+verbatim so the optimized modules can be checked for identical output.
+"""
+
+from itertools import combinations
+from math import gcd, lcm
+from typing import List, Set, Tuple
+
+# --------------------------------------------------
+# Method 1
+# --------------------------------------------------
+
+def method1_lcm_offset_odd_only(divisors: List[int], count: int) -> List[int]:
+    L = lcm(*divisors)
+    results = []
+    i = 1
+    while len(results) < count:
+        # Alternate multipliers: odd index gets +2, even index gets +1
+        if i % 2 == 1:
+            val = i * L + 2
+        else:
+            val = i * L + 1
+
+        if all(val % d != 0 for d in divisors) and val % 2 == 1:
+            results.append(val)
+        i += 1
+    return results
+
+# --------------------------------------------------
+# Method 2
+# --------------------------------------------------
+
+def method_lcm_power_offset(divisors: List[int], count: int, base: int = 2) -> Tuple[List[int], List[Tuple[int, str]], float]:
+    L = lcm(*divisors)
+    results = []
+    combinations = []
+    valid = 0
+    total_tested = 0
+    max_power = 100 # Safety limit to prevent infinite loops
+    power_range = range(1, max_power + 1)
+
+    for p in power_range:
+        if len(results) >= count:
+            break
+
+        # Test both addition and subtraction
+        for op in ['+', '-']:
+            if op == '+':
+                val = L + (base ** p)
+            else:
+                val = abs(L - (base ** p))  # Absolute value to keep positive
+
+            total_tested += 1
+            if all(val % d != 0 for d in divisors):
+                valid += 1
+                results.append(val)
+                combinations.append((val, f"LCM{divisors} {op} {base}^{p}"))
+                if len(results) >= count:
+                    break
+
+    success_rate = (valid / total_tested) * 100 if total_tested > 0 else 0
+    return results, combinations, success_rate
+
+# --------------------------------------------------
+# Method 2.1
+# --------------------------------------------------
+
+def enhanced_lcm_method(
+    main_divisors: List[int],
+    extra_primes: List[int],
+    count: int = 20,
+    max_power: int = 10,
+    max_prime_power: int = 5
+) -> Tuple[List[int], List[str], dict]:
+    L = lcm(*main_divisors)
+    results = []
+    formulas = []
+    stats = {
+        'tested': 0,
+        'valid': 0,
+        'added': 0,
+        'subtracted': 0,
+        'min_power': float('inf'),
+        'max_power': 0
+    }
+
+    # Ensure extra primes aren't in main divisors
+    clean_primes = [p for p in extra_primes if p not in main_divisors]
+
+    for power in range(1, max_power + 1):
+        lcm_multiple = (2 ** power) * L
+        for prime in clean_primes:
+            for p_exp in range(1, max_prime_power + 1):
+                prime_power = prime ** p_exp
+                stats['tested'] += 2  # Test both + and -
+
+                # Addition case
+                val_add = lcm_multiple + prime_power
+                if all(val_add % d != 0 for d in main_divisors):
+                    results.append(val_add)
+                    formulas.append(
+                        f"(2^{power}×LCM{main_divisors}) + {prime}^{p_exp} = {val_add}"
+                    )
+                    stats['valid'] += 1
+                    stats['added'] += 1
+                    stats['min_power'] = min(stats['min_power'], power)
+                    stats['max_power'] = max(stats['max_power'], power)
+
+                # Subtraction case (negative results allowed)
+                val_sub = lcm_multiple - prime_power
+                if all(val_sub % d != 0 for d in main_divisors):
+                    results.append(val_sub)
+                    formulas.append(
+                        f"(2^{power}×LCM{main_divisors}) - {prime}^{p_exp} = {val_sub}"
+                    )
+                    stats['valid'] += 1
+                    stats['subtracted'] += 1
+                    stats['min_power'] = min(stats['min_power'], power)
+                    stats['max_power'] = max(stats['max_power'], power)
+
+                if len(results) >= count:
+                    stats['success_rate'] = (stats['valid'] / stats['tested']) * 100
+                    return results[:count], formulas[:count], stats
+
+    stats['success_rate'] = (stats['valid'] / stats['tested']) * 100
+    return results, formulas, stats
+
+# --------------------------------------------------
+# Method 3
+# --------------------------------------------------
+
+def generate_valid_combinations(D: Set[int], count: int = 10) -> Tuple[List[int], List[Tuple[str, str]]]:
+    results = []
+    comb_descriptions = []
+    primes_in_D = sorted(D)
+    powers_of_2 = [2**p for p in [1, 2, 3 ,4]]  # 2, 4, 8
+
+    # Generate all possible partitions of primes in D
+    for r in range(1, len(primes_in_D)):
+        for left_primes in combinations(primes_in_D, r):
+            left_primes = list(left_primes)
+            right_primes = [p for p in primes_in_D if p not in left_primes]
+
+            # Case 1: 2 is in left term (2^a * product(left_primes))
+            for power_2 in powers_of_2:
+                for left_power in [1, 2 , 3,4]:
+                    left_term = power_2
+                    for p in left_primes:
+                        left_term *= p**left_power
+
+                    for right_power in [1, 2 , 3,4]:
+                        right_term = 1
+                        for p in right_primes:
+                            right_term *= p**right_power
+
+                        total = left_term + right_term
+                        if all(total % d != 0 for d in D):
+                            results.append(total)
+                            desc = (f"{power_2}*{'*'.join(f'{p}^{left_power}' for p in left_primes)}",
+                                    f"{'*'.join(f'{p}^{right_power}' for p in right_primes)}")
+                            comb_descriptions.append(desc)
+                            if len(results) >= count:
+                                return results, comb_descriptions
+
+            # Case 2: 2 is in right term (product(left_primes) + 2^a*product(right_primes))
+            for power_2 in powers_of_2:
+                for left_power in [1, 2 ,3 ,4]:
+                    left_term = 1
+                    for p in left_primes:
+                        left_term *= p**left_power
+
+                    for right_power in [1, 2 ,3,4]:
+                        right_term = power_2
+                        for p in right_primes:
+                            right_term *= p**right_power
+
+                        total = left_term + right_term
+                        if all(total % d != 0 for d in D):
+                            results.append(total)
+                            desc = (f"{'*'.join(f'{p}^{left_power}' for p in left_primes)}",
+                                    f"{power_2}*{'*'.join(f'{p}^{right_power}' for p in right_primes)}")
+                            comb_descriptions.append(desc)
+                            if len(results) >= count:
+                                return results, comb_descriptions
+
+    return results, comb_descriptions
+
+# --------------------------------------------------
+# Method 3.1
+# --------------------------------------------------
+
+def is_valid_combination(a1: int, p1: int, a2: int, p2: int, P1: int, P2: int, divisors: Set[int]) -> bool:
+    x1 = (a1 * p1) ** P1
+    x2 = (a2 * p2) ** P2
+    total = x1 + x2
+    return (
+        p1 not in divisors and  # p₁ ∉ D
+        p2 not in divisors and  # p₂ ∉ D
+        gcd(a1 * p1, a2 * p2) == 1 and  # Terms are coprime
+        ((a1 * p1) % 2 == 0 or (a2 * p2) % 2 == 0) and  # One term is even
+        all(total % d != 0 for d in divisors)  # Sum avoids all d ∈ D
+    )
+
+def generate_method3_values(divisors: Set[int], count: int = 10) -> List[int]:
+    results = set()
+    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+    allowed_primes = [p for p in primes if p not in divisors]  # Primes not in D
+
+    # Generate combinations systematically
+    for a1 in [1, 2, 3, 4,5,6]:  # Small multipliers
+        for a2 in [1, 2, 3, 4,5,6]:
+            for p1 in allowed_primes:
+                for p2 in allowed_primes:
+                    if p1 == p2:  # Ensure terms are coprime
+                        continue
+                    for P1 in [1, 2, 3 , 4 ,5 ,6 ]:  # Small exponents
+                        for P2 in [1, 2, 3 , 4 ,5 ,6 ]:
+                            if is_valid_combination(a1, p1, a2, p2, P1, P2, divisors):
+                                x1 = (a1 * p1) ** P1
+                                x2 = (a2 * p2) ** P2
+                                results.add(x1 + x2)
+                                if len(results) >= count:
+                                    return sorted(results)
+    return sorted(results)
@@ -0,0 +1,56 @@
+"""
+Checkpoint resume of method_2_1.iter_enhanced_lcm_method after a hard exit.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import method_2_1
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CRASH_ARGS = ([3, 5, 7], [11, 13, 17], 5, 3)  # iter_enhanced_lcm_method parameters
+
+PROBE = """\
+import os, method_2_1
+values = method_2_1.iter_enhanced_lcm_method(*{args!r}, checkpoint={path!r}, checkpoint_every={every})
+with open({out!r}, 'a') as f:
+    for i, (v, _) in enumerate(values, 1):
+        if i == {crash_at}:
+            os._exit(1)
+        f.write(f'{{v}}\\n')
+        f.flush()
+"""
+
+@pytest.mark.parametrize('crash_at', [1, 4, 5, 8, 9])
+def test_resume_after_hard_exit_loses_nothing(tmp_path, crash_at):
+    every = 4
+    path, out = str(tmp_path / 'checkpoint.json'), str(tmp_path / 'handled.txt')
+    code = PROBE.format(args=CRASH_ARGS, path=path, every=every, out=out, crash_at=crash_at)
+    # The consumer dies while handling value `crash_at`, without running any cleanup
+    assert subprocess.run([sys.executable, '-c', code], cwd=ROOT).returncode == 1
+    with open(out) as f:
+        handled = [int(line) for line in f]
+    resumed = [v for v, _ in method_2_1.iter_enhanced_lcm_method(*CRASH_ARGS, checkpoint=path,
+                                                                 checkpoint_every=every)]
+    expected = [v for v, _ in method_2_1.iter_enhanced_lcm_method(*CRASH_ARGS)]
+    assert handled == expected[:crash_at - 1]
+    # Values since the last checkpoint are produced again, none are skipped
+    replayed = len(handled) - len(expected) + len(resumed)
+    assert 0 <= replayed <= every
+    assert handled[:len(expected) - len(resumed)] + resumed == expected
+
+def test_completed_run_does_not_resume(tmp_path):
+    path = str(tmp_path / 'checkpoint.json')
+    assert list(method_2_1.iter_enhanced_lcm_method(*CRASH_ARGS, checkpoint=path))
+    assert list(method_2_1.iter_enhanced_lcm_method(*CRASH_ARGS, checkpoint=path)) == []
+
+def test_checkpoint_rejects_other_parameters(tmp_path):
+    path = str(tmp_path / 'checkpoint.json')
+    values = method_2_1.iter_enhanced_lcm_method(*CRASH_ARGS, checkpoint=path)
+    next(values)
+    values.close()
+    with pytest.raises(ValueError):
+        next(method_2_1.iter_enhanced_lcm_method([3, 5], [11], 5, 3, checkpoint=path))
@@ -0,0 +1,143 @@
+"""
+Round trips through the on-disk formats: the ciphertext container, the SQLite
+keystore and the sequence cache.
+"""
+
+import io
+import os
+from itertools import islice
+
+import pytest
+
+import seed_container
+from method_2 import iter_lcm_power_offset
+from method_2_1 import iter_enhanced_lcm_method
+from seed_based_crypto import (
+    BYTE_DOMAIN_SIZE, MODULAR_PRIME, generate_modular_seeds, generate_seeds, get_modular_polynomial,
+    get_polynomial, save_keyfile
+)
+from seed_keystore import KeyStore
+from sequence_cache import SequenceCache
+
+# --------------------------------------------------
+# Container
+# --------------------------------------------------
+
+def _container_round_trip(plain: bytes, seeds, chunk_size: int) -> bytes:
+    encrypted = io.BytesIO()
+    seed_container.encrypt_stream(io.BytesIO(plain), encrypted, seeds, chunk_size)
+    encrypted.seek(0)
+    decrypted = io.BytesIO()
+    assert seed_container.decrypt_stream(encrypted, decrypted) == len(plain)
+    return decrypted.getvalue()
+
+@pytest.mark.parametrize('size,chunk_size', [
+    (0, 4096), (1, 1), (1000, 1), (1000, 4096), (70_000, 4096), (70_000, seed_container.DEFAULT_CHUNK_SIZE),
+])
+def test_container_round_trip(size, chunk_size):
+    plain = os.urandom(size)
+    seeds = generate_seeds(degree=3, bit_length=16, domain_size=BYTE_DOMAIN_SIZE)
+    assert _container_round_trip(plain, seeds, chunk_size) == plain
+
+def test_container_round_trip_varint_words():
+    # 64-bit seeds give words wider than 8 bytes, stored as varints
+    seeds = generate_seeds(degree=3, bit_length=64, domain_size=BYTE_DOMAIN_SIZE)
+    assert seed_container.choose_word_width(get_polynomial(seeds).forward_table(BYTE_DOMAIN_SIZE)) == 0
+    plain = os.urandom(5000)
+    assert _container_round_trip(plain, seeds, 1024) == plain
+
+def test_container_file_round_trip(tmp_path):
+    src, enc, dst = tmp_path / 'plain.bin', tmp_path / 'plain.sdc', tmp_path / 'out.bin'
+    src.write_bytes(os.urandom(10_000))
+    seed_container.encrypt_file(str(src), str(enc), chunk_size=3000)
+    assert seed_container.is_container(str(enc))
+    assert seed_container.decrypt_file(str(enc), str(dst)) == 10_000
+    assert dst.read_bytes() == src.read_bytes()
+
+@pytest.mark.parametrize('modulus', [None, MODULAR_PRIME])
+def test_container_decrypts_legacy_keyfile(tmp_path, modulus):
+    message = "legacy keyfile"
+    if modulus is None:
+        seeds = generate_seeds()
+        cipher = get_polynomial(seeds).encrypt(message)
+    else:
+        seeds = generate_modular_seeds(modulus=modulus)
+        cipher = get_modular_polynomial(seeds, modulus).encrypt(message)
+    keyfile, dst = tmp_path / 'key.json', tmp_path / 'out.txt'
+    save_keyfile(seeds, list(cipher), str(keyfile), modulus=modulus)
+    seed_container.decrypt_file(str(keyfile), str(dst))
+    assert dst.read_text(encoding='utf-8') == message
+
+def test_container_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        seed_container.encrypt_stream(io.BytesIO(b'data'), io.BytesIO(), generate_seeds(), chunk_size=0)
+
+def test_container_rejects_truncated_header():
+    encrypted = io.BytesIO()
+    seeds = generate_seeds(degree=3, bit_length=16, domain_size=BYTE_DOMAIN_SIZE)
+    seed_container.encrypt_stream(io.BytesIO(b'data'), encrypted, seeds)
+    for cut in (2, seed_container._HEADER.size + 1, seed_container._HEADER.size + 3):
+        with pytest.raises(ValueError):
+            seed_container.read_header(io.BytesIO(encrypted.getvalue()[:cut]))
+
+# --------------------------------------------------
+# Keystore
+# --------------------------------------------------
+
+def test_keystore_round_trip(tmp_path):
+    path = str(tmp_path / 'keys.db')
+    seeds = generate_seeds()
+    modular_seeds = generate_modular_seeds()
+    with KeyStore(path) as store:
+        plain_id = store.add_key(seeds)
+        modular_id = store.add_key(modular_seeds, modulus=MODULAR_PRIME)
+        negative_id = store.add_key([-5, 3, -(1 << 70), 1])
+        store.encrypt(plain_id, "plain key")
+        store.encrypt(modular_id, "modular key")
+        store.put_cipher(negative_id, [-1, 0, 1 << 80, -(1 << 80)], name="signed")
+    with KeyStore(path) as store:
+        assert len(store) == 3
+        assert store.get_seeds(plain_id) == seeds
+        assert store.get_seeds(negative_id) == [-5, 3, -(1 << 70), 1]
+        assert store.decrypt(plain_id) == "plain key"
+        assert store.decrypt(modular_id) == "modular key"
+        assert store.get_cipher(negative_id, "signed") == [-1, 0, 1 << 80, -(1 << 80)]
+        assert set(store.load_keys([plain_id, modular_id])) == {plain_id, modular_id}
+        with pytest.raises(KeyError):
+            store.get_key('missing')
+
+@pytest.mark.parametrize('modulus', [None, MODULAR_PRIME])
+def test_keystore_imports_legacy_keyfile(tmp_path, modulus):
+    if modulus is None:
+        seeds = generate_seeds()
+        cipher = get_polynomial(seeds).encrypt("imported")
+    else:
+        seeds = generate_modular_seeds(modulus=modulus)
+        cipher = get_modular_polynomial(seeds, modulus).encrypt("imported")
+    keyfile = str(tmp_path / 'key.json')
+    save_keyfile(seeds, list(cipher), keyfile, modulus=modulus)
+    with KeyStore(':memory:') as store:
+        key_id = store.import_keyfile(keyfile)
+        assert store.decrypt(key_id) == "imported"
+
+# --------------------------------------------------
+# Sequence Cache
+# --------------------------------------------------
+
+def test_sequence_cache_extends_from_stored_position(tmp_path):
+    params = dict(main_divisors=[3, 5, 7], extra_primes=[11, 13, 17, 19], max_power=8, max_prime_power=6)
+    expected = [v for v, _ in iter_enhanced_lcm_method(*params.values())]
+    cache = SequenceCache(str(tmp_path))
+    for count in (1, 10, 11, 150, len(expected) + 5):
+        assert cache.get('enhanced_lcm_method', count, **params) == expected[:count]
+    # A fresh instance reads the complete entry back from disk
+    assert SequenceCache(str(tmp_path)).get('enhanced_lcm_method', 10**6, **params) == expected
+
+@pytest.mark.parametrize('max_power', [None, 40])
+def test_sequence_cache_method2_wide_values(tmp_path, max_power):
+    expected = [v for _, _, v in islice(iter_lcm_power_offset([3, 5, 7, 11], 2, max_power), 3000)]
+    cache = SequenceCache(str(tmp_path))
+    for count in (100, 2999, 3000):
+        assert cache.get('method_lcm_power_offset', count, divisors=[11, 7, 5, 3], base=2,
+                         max_power=max_power) == expected[:count]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
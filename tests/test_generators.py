@@ -0,0 +1,61 @@
+"""
+Output equality of the optimized generators against the reference implementations.
+"""
+
+from itertools import islice
+
+import pytest
+
+import method_1
+import method_2
+import method_2_1
+import method_3
+import method_3_1
+import reference_methods as ref
+
+METHOD1_CASES = [[3, 5], [3, 5, 7, 11], [9, 15, 21]]
+METHOD2_CASES = [([3, 5, 7], 2), ([3, 5, 7, 11, 13], 2), ([5, 7, 9], 3), ([3, 5, 7, 11], 10)]
+
+@pytest.mark.parametrize('divisors', METHOD1_CASES)
+def test_method1_sieved_matches_reference(divisors):
+    expected = ref.method1_lcm_offset_odd_only(divisors, 2000)
+    assert method_1.method1_lcm_offset_odd_only(divisors, 2000) == expected
+    assert method_1.method1_lcm_offset_odd_only_sieved(divisors, 2000, block_size=64) == expected
+
+@pytest.mark.parametrize('divisors,base', METHOD2_CASES)
+@pytest.mark.parametrize('count', [1, 7, 50, 1000])
+def test_method2_matches_reference(divisors, base, count):
+    assert method_2.method_lcm_power_offset(divisors, count, base) == ref.method_lcm_power_offset(divisors, count, base)
+
+@pytest.mark.parametrize('count', [1, 5, 40, 10_000])
+def test_method2_1_matches_reference(count):
+    args = ([3, 5, 7], [11, 13, 5, 17, 19], count, 6, 4)
+    assert method_2_1.enhanced_lcm_method(*args) == ref.enhanced_lcm_method(*args)
+    values = [v for v, _ in method_2_1.iter_enhanced_lcm_method(*args[:2], *args[3:])]
+    assert values[:count] == ref.enhanced_lcm_method(*args)[0]
+
+@pytest.mark.parametrize('D', [{3, 5, 7}, {3, 5, 7, 11, 13}])
+@pytest.mark.parametrize('count', [1, 30, 100_000])
+@pytest.mark.parametrize('workers', [1, 2])
+def test_method3_matches_reference(D, count, workers):
+    expected = ref.generate_valid_combinations(D, count)
+    assert method_3.generate_valid_combinations(D, count, workers=workers, partitions_per_task=3) == expected
+
+@pytest.mark.parametrize('D', [{3, 5}, {3, 5, 7, 11}, {2, 3}])
+@pytest.mark.parametrize('count', [1, 500])
+def test_method3_1_matches_reference(D, count):
+    assert method_3_1.generate_method3_values(D, count) == ref.generate_method3_values(D, count)
+
+def test_method3_1_sorted_covers_reference_space():
+    D = {3, 5, 7, 11}
+    space = ref.generate_method3_values(D, 10**9)
+    assert list(method_3_1.iter_method3_values(D)) == space
+    assert method_3_1.generate_method3_values_sorted(D, 300) == space[:300]
+
+def test_method3_1_unbounded_prefix():
+    # Terms over primes above 97 are at least 101 and the smallest term is 2, so
+    # values below 103 are the same with or without the prime limit
+    D = {3, 5, 7}
+    bounded = [v for v in method_3_1.iter_method3_values(D) if v < 103]
+    unbounded = list(islice(method_3_1.iter_method3_values(D, None), len(bounded)))
+    assert unbounded == bounded